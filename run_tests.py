@@ -52,15 +52,14 @@ def run_tests_with_coverage():
     print("COVERAGE REPORT")
     print("="*70 + "\n")
 
-    cov.report()
-
-    # Generate HTML report
-    html_dir = Path('htmlcov')
-    cov.html_report(directory=str(html_dir))
-    print(f"\n📊 HTML coverage report generated: {html_dir}/index.html")
-
-    # Calculate coverage percentage
-    total_coverage = cov.report(file=open(os.devnull, 'w'))
+    # Single analysis pass: report() prints the table and returns the total
+    total_coverage = cov.report()
+
+    # Generate HTML report only when requested (GENERATE_HTML_COV=1)
+    if os.environ.get('GENERATE_HTML_COV') == '1':
+        html_dir = Path('htmlcov')
+        cov.html_report(directory=str(html_dir))
+        print(f"\n📊 HTML coverage report generated: {html_dir}/index.html")
 
     print("\n" + "="*70)
     print(f"Total Coverage: {total_coverage:.1f}%")
@@ -8,59 +8,477 @@ import os
 import sys
 import json
 import argparse
-import shutil
+import functools
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Any, Tuple
-from jinja2 import Environment, FileSystemLoader, Template
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Any, Tuple, ClassVar, TYPE_CHECKING
 import time
 
+# jinja2 and shutil are imported lazily where needed to keep CLI start-up
+# (--help, argument and input validation errors) fast
+if TYPE_CHECKING:
+    from jinja2 import Environment, FileSystemBytecodeCache
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from security.validator import SecurityValidator, validate_all_inputs
 
+logger = logging.getLogger(__name__)
+
+# Separator line for the generation banner
+_RULE = '=' * 60
+
+# Templates shipped with the generator, used when a custom template_dir
+# lacks an optional template (e.g. the project README)
+PACKAGED_TEMPLATE_DIR = Path(__file__).resolve().parent.parent.parent / 'template-modules'
+
+# Buffer size for user-space copy fallback
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def _fast_copy_file(src: str, dst: str) -> None:
+    """
+    Copy file contents from src to dst without copying metadata
+
+    Tries kernel-side copies first (no user-space buffer): os.copy_file_range,
+    which can share extents on reflink filesystems, then os.sendfile, and
+    falls back to a buffered copy otherwise. Each fallback continues from
+    the current file offsets.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while os.copy_file_range(in_fd, out_fd, COPY_BUFFER_SIZE):
+                    pass
+                return
+            except OSError:
+                # e.g. cross-filesystem copy on older kernels
+                pass
+        if sys.platform.startswith('linux'):
+            try:
+                while os.sendfile(out_fd, in_fd, None, COPY_BUFFER_SIZE):
+                    pass
+                return
+            except OSError:
+                pass
+        import shutil
+        shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_bytecode_cache() -> Optional['FileSystemBytecodeCache']:
+    """
+    Get the shared on-disk Jinja2 bytecode cache
+
+    Compiled templates are persisted across runs in ~/.cache/infra-accelerator/jinja
+    (override with the INFRA_JINJA_CACHE environment variable).
+
+    Returns:
+        Bytecode cache, or None if the cache directory cannot be created or written
+    """
+    from jinja2 import FileSystemBytecodeCache
+
+    cache_dir = os.environ.get(
+        'INFRA_JINJA_CACHE',
+        str(Path.home() / '.cache' / 'infra-accelerator' / 'jinja')
+    )
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        writable = os.access(cache_dir, os.W_OK | os.X_OK)
+    except OSError:
+        writable = False
+    if not writable:
+        logger.warning("⚠️  Warning: Cannot create template cache directory %s, caching disabled",
+                       cache_dir)
+        return None
+    return FileSystemBytecodeCache(directory=cache_dir, pattern='%s.cache')
+
+
+def _clear_template_cache() -> None:
+    """Remove all compiled templates from the on-disk Jinja2 bytecode cache"""
+    bytecode_cache = _get_bytecode_cache()
+    if bytecode_cache is None:
+        return
+    # Only the cache's own *.cache files are removed, never the directory
+    # itself (INFRA_JINJA_CACHE may point anywhere)
+    bytecode_cache.clear()
+    logger.info("🧹 Cleared template cache in %s", bytecode_cache.directory)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_yaml_loader() -> Optional[type]:
+    """
+    Get the fastest available safe YAML loader class
+
+    Prefers the libyaml-backed CSafeLoader and notes once when PyYAML was
+    built without libyaml.
+
+    Returns:
+        Loader class, or None if PyYAML is not installed
+    """
+    try:
+        import yaml
+    except ImportError:
+        return None
+    if getattr(yaml, '__with_libyaml__', False):
+        return yaml.CSafeLoader
+    logger.info("ℹ️  PyYAML has no libyaml support, YAML validation uses the pure-Python parser")
+    return yaml.SafeLoader
+
+
+def _write_file(path: str, data: bytes, mode: Optional[int] = None) -> None:
+    """
+    Atomically write pre-encoded data to path
+
+    The data is written to a temporary file in the same directory, which
+    then replaces path, so an interrupted run never leaves a truncated file
+    behind. An explicit mode is applied subject to the process umask (the
+    kernel filters it when the temporary file is created). Without one, a
+    replaced file keeps its current permissions and a new file gets 0o666
+    minus the umask, as with a plain open().
+    """
+    keep_mode = None
+    if mode is None:
+        try:
+            keep_mode = os.stat(path).st_mode & 0o7777
+        except FileNotFoundError:
+            pass
+        mode = 0o666
+
+    # Short fixed-length temp name, so names near NAME_MAX still fit
+    directory = os.path.dirname(path) or '.'
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_CLOEXEC', 0)
+    while True:
+        tmp_path = os.path.join(directory, f'.infra-{os.urandom(4).hex()}.tmp')
+        try:
+            fd = os.open(tmp_path, flags, mode)
+            break
+        except FileExistsError:
+            continue
+
+    try:
+        try:
+            if keep_mode is not None:
+                os.fchmod(fd, keep_mode)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _list_j2(dir_path: Path) -> List[os.DirEntry[str]]:
+    """List .j2 template files in dir_path (sorted by name) with a single scandir pass"""
+    with os.scandir(dir_path) as entries:
+        return sorted(
+            (e for e in entries if e.name.endswith('.j2') and e.is_file()),
+            key=lambda e: e.name
+        )
+
+
+def _copy_file_with_mode(src: str, dst: str) -> None:
+    """
+    Copy src to dst with _fast_copy_file and keep its permission bits
+
+    Serves as a shutil.copytree copy_function; timestamps are not copied.
+    """
+    _fast_copy_file(src, dst)
+    os.chmod(dst, os.stat(src).st_mode & 0o7777)
+
+
+def _tree_fingerprint(root: str, ignore_patterns: Tuple[str, ...]) -> str:
+    """
+    Compute a cheap fingerprint of a directory tree
+
+    Hashes the relative path, size and mtime of every file (no contents are
+    read), skipping entries that match ignore_patterns.
+    """
+    import fnmatch
+    import hashlib
+
+    def ignored(name: str) -> bool:
+        return any(fnmatch.fnmatch(name, pattern) for pattern in ignore_patterns)
+
+    digest = hashlib.blake2b(digest_size=16)
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not ignored(d))
+        rel_dir = os.path.relpath(dirpath, root)
+        for name in sorted(filenames):
+            if ignored(name):
+                continue
+            st = os.stat(os.path.join(dirpath, name))
+            digest.update(
+                f"{os.path.join(rel_dir, name)}\0{st.st_size}\0{st.st_mtime_ns}\n".encode()
+            )
+    return digest.hexdigest()
+
+
+def _copy_tree(src: str, dst: str) -> None:
+    """
+    Recursively copy directory contents using a single scandir pass per directory
+
+    Permission bits are kept (e.g. executable scripts under code/), as
+    shutil.copytree would; timestamps are not.
+    """
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir():
+                _copy_tree(entry.path, target)
+            else:
+                _copy_file_with_mode(entry.path, target)
+
+
+# infra/config skeleton files; sample tfvars uses str.format_map placeholders
+_CONFIG_README = """# Configuration Files
+
+This directory should contain environment-specific `.tfvars` files:
+- `dev.tfvars`
+- `uat.tfvars`
+- `prod.tfvars`
+
+These files are gitignored and should contain sensitive configuration values.
+
+## Example
+
+```hcl
+env     = "dev"
+account = "123456789012"
+region  = "us-east-1"
+dns     = "example.com"
+```
+"""
+
+_SAMPLE_TFVARS_TEMPLATE = """# Sample configuration for {{{{ env }}}}
+env     = "{{{{ env }}}}"
+account = "YOUR_AWS_ACCOUNT_ID"
+region  = "{region}"
+
+# Add additional variables as needed
+"""
+
+# S3 backend helper scripts (str.format_map placeholders)
+_MIGRATION_SCRIPT_TEMPLATE = """#!/bin/bash
+# Migrate Terraform component from local to S3 backend
+#
+# Usage: ./scripts/migrate-to-s3-backend.sh <component> <environment>
+# Example: ./scripts/migrate-to-s3-backend.sh vpc dev
+
+set -e
+
+COMPONENT=$1
+ENV=$2
+
+if [ -z "$COMPONENT" ] || [ -z "$ENV" ]; then
+    echo "Usage: $0 <component> <environment>"
+    echo "Example: $0 vpc dev"
+    exit 1
+fi
+
+COMPONENT_DIR="infra/$COMPONENT"
+
+if [ ! -d "$COMPONENT_DIR" ]; then
+    echo "❌ Error: Component directory not found: $COMPONENT_DIR"
+    exit 1
+fi
+
+echo "🔄 Migrating $COMPONENT ($ENV) to S3 backend..."
+echo ""
+echo "Backend configuration:"
+echo "  Bucket: {state_bucket}"
+echo "  Key: $ENV/$COMPONENT/terraform.tfstate"
+echo "  Locking: S3 Native (Terraform 1.10+)"
+echo "  Region: {region}"
+echo ""
+
+cd "$COMPONENT_DIR"
+
+# Reinitialize with backend config
+terraform init \\
+  -migrate-state \\
+  -backend-config="key=$ENV/$COMPONENT/terraform.tfstate"
+
+echo "✅ Migration complete!"
+echo ""
+echo "Verify state in S3:"
+echo "  aws s3 ls s3://{state_bucket}/$ENV/$COMPONENT/"
+"""
+
+_INIT_SCRIPT_TEMPLATE = """#!/bin/bash
+# Initialize Terraform with S3 backend configuration
+#
+# Usage: ./scripts/init-backend.sh <component> <environment>
+# Example: ./scripts/init-backend.sh vpc dev
+
+set -e
+
+COMPONENT=$1
+ENV=$2
+
+if [ -z "$COMPONENT" ] || [ -z "$ENV" ]; then
+    echo "Usage: $0 <component> <environment>"
+    echo "Example: $0 vpc dev"
+    exit 1
+fi
+
+COMPONENT_DIR="infra/$COMPONENT"
+
+if [ ! -d "$COMPONENT_DIR" ]; then
+    echo "❌ Error: Component directory not found: $COMPONENT_DIR"
+    exit 1
+fi
+
+echo "🔧 Initializing $COMPONENT ($ENV) with S3 backend..."
+
+cd "$COMPONENT_DIR"
+
+terraform init \\
+  -backend-config="key=$ENV/$COMPONENT/terraform.tfstate"
+
+echo "✅ Initialization complete!"
+"""
+
+_VALIDATE_SCRIPT_TEMPLATE = """#!/bin/bash
+# Validate S3 backend configuration
+#
+# Usage: ./scripts/validate-backend.sh
+
+set -e
+
+BUCKET="{state_bucket}"
+REGION="{region}"
+
+echo "🔍 Validating S3 backend configuration..."
+echo ""
+
+# Check S3 bucket
+echo "Checking S3 bucket: $BUCKET"
+if aws s3 ls "s3://$BUCKET" --region "$REGION" >/dev/null 2>&1; then
+    echo "  ✅ S3 bucket exists and is accessible"
+
+    # Check versioning
+    VERSIONING=$(aws s3api get-bucket-versioning --bucket "$BUCKET" --region "$REGION" --query 'Status' --output text 2>/dev/null || echo "None")
+    if [ "$VERSIONING" = "Enabled" ]; then
+        echo "  ✅ Versioning is enabled"
+    else
+        echo "  ⚠️  Warning: Versioning is not enabled"
+    fi
+
+    # Check encryption
+    ENCRYPTION=$(aws s3api get-bucket-encryption --bucket "$BUCKET" --region "$REGION" 2>/dev/null && echo "Enabled" || echo "Disabled")
+    if [ "$ENCRYPTION" = "Enabled" ]; then
+        echo "  ✅ Encryption is enabled"
+    else
+        echo "  ⚠️  Warning: Encryption is not enabled"
+    fi
+else
+    echo "  ❌ S3 bucket does not exist or is not accessible"
+    exit 1
+fi
+
+echo ""
+echo "✅ S3 backend configuration is valid!"
+echo ""
+echo "Note: Using S3 native state locking (Terraform 1.10+)"
+echo ""
+echo "✅ Backend validation complete!"
+"""
+
+# S3 backend helper scripts: (file name, template), written to scripts/ in order
+_BACKEND_SCRIPTS: Tuple[Tuple[str, str], ...] = (
+    ('migrate-to-s3-backend.sh', _MIGRATION_SCRIPT_TEMPLATE),
+    ('init-backend.sh', _INIT_SCRIPT_TEMPLATE),
+    ('validate-backend.sh', _VALIDATE_SCRIPT_TEMPLATE),
+)
+
 
 class InfrastructureGenerator:
     """Generate Terraform infrastructure from templates"""
 
-    # Available components with templates
-    AVAILABLE_COMPONENTS = [
+    # Available components with templates (ordered, for user-facing messages)
+    AVAILABLE_COMPONENTS_ORDERED = (
         'terraform-backend',  # S3 bucket with native state locking (ready)
         'vpc',                # VPC networking (ready)
         'eks-auto',           # EKS Auto Mode cluster (ready)
         'rds',                # Aurora PostgreSQL Serverless v2 (ready)
         # Future components (templates to be created):
         # 'secrets', 'eks', 'services', 'opensearch', 'monitoring', 'common'
-    ]
+    )
+
+    # Available components for O(1) membership checks
+    AVAILABLE_COMPONENTS = frozenset(AVAILABLE_COMPONENTS_ORDERED)
 
     # Component dependencies (only for available components)
     DEPENDENCIES = {
-        'terraform-backend': [],  # No dependencies (bootstrap component)
-        'vpc': [],                # No dependencies (foundational)
-        'eks-auto': ['vpc'],      # EKS Auto Mode - requires VPC only
-        'rds': ['vpc'],           # Aurora PostgreSQL Serverless v2 - requires VPC
+        'terraform-backend': (),  # No dependencies (bootstrap component)
+        'vpc': (),                # No dependencies (foundational)
+        'eks-auto': ('vpc',),     # EKS Auto Mode - requires VPC only
+        'rds': ('vpc',),          # Aurora PostgreSQL Serverless v2 - requires VPC
         # Future dependencies (when components are added):
-        # 'secrets': ['eks', 'services'],
-        # 'eks': ['vpc'],
-        # 'services': ['vpc', 'eks'],
-        # 'opensearch': ['vpc', 'services', 'eks'],
-        # 'monitoring': ['vpc', 'eks', 'services', 'rds'],
-        # 'common': []
+        # 'secrets': ('eks', 'services'),
+        # 'eks': ('vpc',),
+        # 'services': ('vpc', 'eks'),
+        # 'opensearch': ('vpc', 'services', 'eks'),
+        # 'monitoring': ('vpc', 'eks', 'services', 'rds'),
+        # 'common': ()
     }
 
     # Files to exclude from generation (client-specific or problematic)
     EXCLUDE_FILES = {
-        'services': ['sftp.tf', 'zendesk.tf', 'vanta.tf'],  # Client-specific integrations
+        'services': frozenset({'sftp.tf', 'zendesk.tf', 'vanta.tf'}),  # Client-specific integrations
     }
 
     # Components that require local modules
     REQUIRES_MODULES = {
-        'services': ['sftp'],  # services uses modules/sftp (but excluded by default)
+        'services': frozenset({'sftp'}),  # services uses modules/sftp (but excluded by default)
         # Add more as needed
     }
 
-    # Available CI providers
-    AVAILABLE_CI_PROVIDERS = ['gitlab', 'github', 'azuredevops']
+    # Files and directories never copied into the generated modules/ snapshot
+    MODULES_IGNORE_PATTERNS = ('.git*', '__pycache__', '*.pyc', '*.pyo')
+
+    # Fingerprint of modules/ source stored in the snapshot to skip unchanged re-copies
+    MODULES_FINGERPRINT_FILE = '.infra_fingerprint'
+
+    # CI providers: name -> (template dir, template file, output file, display name);
+    # directories are relative to template_dir, output files to the output root
+    CI_PROVIDERS = {
+        'gitlab': ('ci-providers/gitlab', 'gitlab-ci.yml.j2',
+                   '.gitlab-ci.yml', 'GitLab CI'),
+        'github': ('ci-providers/github', 'terraform-ci.yml.j2',
+                   '.github/workflows/terraform-ci.yml', 'GitHub Actions'),
+        'azuredevops': ('ci-providers/azuredevops', 'azure-pipelines.yml.j2',
+                        'azure-pipelines.yml', 'Azure DevOps'),
+    }
+
+    # Pre-ci-providers/ template locations, still accepted for backward compatibility
+    CI_LEGACY_TEMPLATE_DIRS = {'gitlab': 'gitlab-ci'}
+
+    # Upper bound for threads generating components / rendering and copying files
+    MAX_IO_WORKERS = 8
+
+    # Performance: Jinja2 environments keyed by template dir, shared across
+    # instances so compiled templates are reused
+    _JINJA_ENV_CACHE: ClassVar[Dict[str, 'Environment']] = {}
+
+    # Performance: fixed instance layout, no per-instance __dict__
+    __slots__ = (
+        'project_name', 'components', 'environments', 'config', 'ci_provider',
+        'output_dir', 'template_dir', 'needs_modules', '_template_context',
+    )
 
     def __init__(self, project_name: str, components: List[str],
                  environments: List[str], config: Dict[str, Any]) -> None:
@@ -82,9 +500,6 @@ class InfrastructureGenerator:
         self.template_dir = Path(config.get('template_dir', 'template-modules'))
         self.needs_modules = False
 
-        # Performance: Cache Jinja2 environment
-        self._jinja_env_cache: Optional[Environment] = None
-
         # Security: Validate paths
         self.output_dir = SecurityValidator.validate_path(self.output_dir.resolve())
         if self.template_dir.exists():
@@ -92,46 +507,77 @@ class InfrastructureGenerator:
                 self.template_dir.resolve()
             )
 
+        # Component template context: identical for every component, so it is
+        # built and sanitized (SSTI protection) once and kept read-only
+        self._template_context = MappingProxyType(SecurityValidator.sanitize_template_context({
+            'project_name': self.project_name,
+            'environments': self.environments,
+            'region': config.get('region', 'us-east-1'),
+            'aws_account_id': config.get('aws_account_id', ''),
+            'aws_profile': config.get('aws_profile', 'default'),
+            # Backend configuration (local or S3 with native locking)
+            'backend_type': config.get('backend_type', 'local'),
+            'state_bucket': config.get('state_bucket', ''),
+            **config
+        }))
+
     def validate_components(self) -> None:
-        """Validate selected components and their dependencies"""
-        for component in self.components:
+        """Validate selected components, add missing dependencies and sort them"""
+        self.components = self._resolve(self.components)
+        logger.info("✓ Components to generate (in order): %s", self.components)
+
+    def _resolve(self, components: List[str]) -> List[str]:
+        """
+        Expand transitive dependencies and sort components (Kahn's algorithm, O(V+E))
+
+        The dependency graph is walked once: the breadth-first search that
+        auto-adds missing dependencies also builds the in-degrees and the
+        reverse (dependency -> dependents) graph used for ordering. The result
+        is deterministic for a given input order.
+
+        Raises:
+            ValueError: If a component is unknown or the components have
+                circular dependencies
+        """
+        # Deduplicate while preserving input order
+        in_degree = dict.fromkeys(components, 0)
+        dependents: Dict[str, List[str]] = {component: [] for component in in_degree}
+
+        queue = deque(in_degree)
+        while queue:
+            component = queue.popleft()
             if component not in self.AVAILABLE_COMPONENTS:
-                available = ', '.join(self.AVAILABLE_COMPONENTS)
+                available = ', '.join(self.AVAILABLE_COMPONENTS_ORDERED)
                 raise ValueError(
                     f"❌ Unknown component: '{component}'\n"
                     f"   Available components: {available}\n"
                     f"   For custom components, ensure templates exist in 'template-modules/{component}/'"
                 )
 
-            # Check dependencies
-            for dep in self.DEPENDENCIES.get(component, []):
-                if dep not in self.components:
-                    print(f"⚠️  Auto-adding dependency: '{component}' requires '{dep}'")
-                    self.components.append(dep)
+            for dep in self.DEPENDENCIES.get(component, ()):
+                if dep not in in_degree:
+                    logger.warning("⚠️  Auto-adding dependency: '%s' requires '%s'", component, dep)
+                    in_degree[dep] = 0
+                    dependents[dep] = []
+                    queue.append(dep)
+                in_degree[component] += 1
+                dependents[dep].append(component)
 
-        # Sort components by dependency order
-        self.components = self._sort_by_dependencies(self.components)
-        print(f"✓ Components to generate (in order): {self.components}")
-
-    def _sort_by_dependencies(self, components: List[str]) -> List[str]:
-        """Sort components based on their dependencies"""
+        queue = deque(component for component, degree in in_degree.items() if degree == 0)
         sorted_components = []
-        remaining = components.copy()
-
-        while remaining:
-            # Find components with all dependencies satisfied
-            for component in remaining:
-                deps = self.DEPENDENCIES.get(component, [])
-                if all(dep in sorted_components or dep not in components for dep in deps):
-                    sorted_components.append(component)
-                    remaining.remove(component)
-                    break
-            else:
-                # Circular dependency detected
-                print(f"⚠️  Warning: Possible circular dependency detected in: {remaining}")
-                print(f"   Adding remaining components in arbitrary order")
-                sorted_components.extend(remaining)
-                break
+        while queue:
+            component = queue.popleft()
+            sorted_components.append(component)
+            for dependent in dependents[component]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
+
+        if len(sorted_components) != len(in_degree):
+            cyclic = [component for component, degree in in_degree.items() if degree > 0]
+            raise ValueError(
+                f"❌ Circular dependency detected between components: {', '.join(cyclic)}"
+            )
 
         return sorted_components
 
@@ -140,69 +586,114 @@ class InfrastructureGenerator:
         for component in self.components:
             if component in self.REQUIRES_MODULES:
                 self.needs_modules = True
-                print(f"Component {component} requires modules, will copy modules/ directory")
+                logger.info("Component %s requires modules, will copy modules/ directory", component)
                 break
 
-    def _get_jinja_env(self, component_dir: Path) -> Environment:
+    def _get_jinja_env(self, template_dir: Path) -> 'Environment':
         """
         Get or create cached Jinja2 environment for better performance
 
+        One environment is kept per template directory, so each directory keeps
+        its compiled templates in memory. Compiled bytecode is also persisted on
+        disk (see _get_bytecode_cache) to skip parsing on subsequent runs.
+
+        Autoescaping is only enabled for HTML/XML templates: HTML escaping is
+        wrong for HCL/YAML output (it mangles quotes and ampersands). Template
+        input is protected by SecurityValidator.sanitize_template_context.
+
         Args:
-            component_dir: Template component directory
+            template_dir: Template directory
 
         Returns:
             Jinja2 Environment
         """
-        if self._jinja_env_cache is None:
-            self._jinja_env_cache = Environment(
-                loader=FileSystemLoader(str(component_dir)),
-                autoescape=True,  # Security: Enable autoescaping
+        key = str(template_dir)
+        env = self._JINJA_ENV_CACHE.get(key)
+        if env is None:
+            from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+            env = Environment(
+                loader=FileSystemLoader(key),
+                autoescape=select_autoescape(
+                    enabled_extensions=('html', 'htm', 'xml'),
+                    default_for_string=False,
+                    default=False
+                ),
                 trim_blocks=True,
-                lstrip_blocks=True
+                lstrip_blocks=True,
+                bytecode_cache=_get_bytecode_cache(),
+                auto_reload=False,  # Templates don't change during a run
+                cache_size=-1
             )
-        else:
-            # Update loader for new component
-            self._jinja_env_cache.loader = FileSystemLoader(str(component_dir))
+            env = self._JINJA_ENV_CACHE.setdefault(key, env)
 
-        return self._jinja_env_cache
+        return env
 
     def _copy_modules(self, output_dir: Path) -> None:
         """Copy modules directory to generated infrastructure"""
-        print("Copying modules directory...")
+        logger.info("Copying modules directory...")
 
         modules_src = Path('modules')
         if not modules_src.exists():
-            print("⚠️  Warning: modules/ directory not found")
-            print("   Skipping module copy - only needed for components with local modules")
+            logger.warning("⚠️  Warning: modules/ directory not found\n"
+                           "   Skipping module copy - only needed for components with local modules")
             return
 
+        import shutil
+
         # Security: Validate paths
         modules_src = SecurityValidator.validate_path(modules_src.resolve())
         modules_dest = output_dir / 'modules'
 
-        # Remove existing modules directory if present
-        if modules_dest.exists():
-            shutil.rmtree(modules_dest)
+        # Skip the copy entirely if the snapshot matches the source tree
+        fingerprint = _tree_fingerprint(str(modules_src), self.MODULES_IGNORE_PATTERNS)
+        try:
+            current = (modules_dest / self.MODULES_FINGERPRINT_FILE).read_text()
+        except OSError:
+            current = None
+        if current == fingerprint:
+            logger.info("✓ modules/ directory is up to date in %s", modules_dest)
+            return
 
-        # Copy entire modules directory
+        # Snapshot modules directory with kernel-side copies (extents are
+        # shared on reflink filesystems, but never inodes, so editing the
+        # output cannot touch the source). Copy into a sibling directory
+        # first so a failed copy never leaves a partial modules/ behind.
+        modules_tmp = modules_dest.with_name(modules_dest.name + '.tmp')
+        shutil.rmtree(modules_tmp, ignore_errors=True)
         shutil.copytree(
             modules_src,
-            modules_dest,
-            ignore=shutil.ignore_patterns('.git*', '__pycache__', '*.pyc', '*.pyo')
+            modules_tmp,
+            ignore=shutil.ignore_patterns(*self.MODULES_IGNORE_PATTERNS),
+            copy_function=_copy_file_with_mode
+        )
+        _write_file(
+            str(modules_tmp / self.MODULES_FINGERPRINT_FILE), fingerprint.encode('utf-8')
         )
-        print(f"✓ Copied modules/ directory to {modules_dest}")
+
+        # Move the previous snapshot aside rather than deleting it first, so
+        # modules/ is only ever missing between two renames
+        modules_old = modules_dest.with_name(modules_dest.name + '.old')
+        shutil.rmtree(modules_old, ignore_errors=True)
+        had_previous = modules_dest.exists()
+        if had_previous:
+            os.replace(modules_dest, modules_old)
+        try:
+            os.replace(modules_tmp, modules_dest)
+        except OSError:
+            if had_previous:
+                os.replace(modules_old, modules_dest)
+            raise
+        shutil.rmtree(modules_old, ignore_errors=True)
+        logger.info("✓ Copied modules/ directory to %s", modules_dest)
 
     def generate(self) -> None:
         """Generate infrastructure code"""
-        print(f"\n{'='*60}")
-        print(f"🚀 Generating infrastructure for project: {self.project_name}")
-        print(f"📦 Environments: {', '.join(self.environments)}")
-        print(f"{'='*60}\n")
+        logger.info("\n%s\n🚀 Generating infrastructure for project: %s\n📦 Environments: %s\n%s\n",
+                    _RULE, self.project_name, ', '.join(self.environments), _RULE)
 
-        # Create output directory
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Each sub-generator creates the directory it writes into
         infra_dir = self.output_dir / 'infra'
-        infra_dir.mkdir(exist_ok=True)
 
         # Check if we need to copy modules
         self._check_modules_needed()
@@ -211,9 +702,23 @@ class InfrastructureGenerator:
         if self.needs_modules:
             self._copy_modules(infra_dir.parent)
 
-        # Generate each component
-        for component in self.components:
-            self._generate_component(component, infra_dir)
+        # Generate components concurrently: each one only writes to its own
+        # directory, the dependency order matters for deployment, not generation.
+        # Progress is logged per component in submission order, so the output
+        # stays deterministic.
+        with ThreadPoolExecutor(
+            max_workers=min(self.MAX_IO_WORKERS, len(self.components))
+        ) as executor:
+            results = executor.map(
+                lambda component: self._generate_component(component, infra_dir),
+                self.components
+            )
+            for component, written in zip(self.components, results):
+                logger.info("📝 Generating component: %s", component)
+                for action, name in written:
+                    logger.info("  %s: %s", action, name)
+                logger.info("✓ component %s: generated %d files", component,
+                            sum(action != 'Skipping' for action, _ in written))
 
         # Generate CI/CD config based on provider
         self._generate_ci_config(infra_dir.parent)
@@ -228,535 +733,318 @@ class InfrastructureGenerator:
         if self.config.get('backend_type') == 's3':
             self._generate_backend_scripts(infra_dir.parent)
 
-        print(f"\n{'='*60}")
-        print(f"✅ Infrastructure generated successfully!")
-        print(f"📁 Output directory: {self.output_dir}")
         if self.config.get('backend_type') == 's3':
-            print(f"📦 Backend: S3 ({self.config.get('state_bucket')})")
+            backend = f"S3 ({self.config.get('state_bucket')})"
         else:
-            print(f"📦 Backend: Local (consider S3 for production)")
-        print(f"{'='*60}\n")
+            backend = "Local (consider S3 for production)"
+        logger.info("\n%s\n✅ Infrastructure generated successfully!\n📁 Output directory: %s\n"
+                    "📦 Backend: %s\n%s\n", _RULE, self.output_dir, backend, _RULE)
 
-    def _generate_component(self, component: str, infra_dir: Path) -> None:
-        """Generate a single component"""
-        print(f"📝 Generating component: {component}")
+    def _generate_component(self, component: str,
+                            infra_dir: Path) -> List[Tuple[str, str]]:
+        """
+        Generate a single component
+
+        Runs on a worker thread, so per-file progress is returned rather
+        than logged; generate() logs it in component order.
+
+        Returns:
+            (action, name) pairs for every file or directory written
+        """
+        written: List[Tuple[str, str]] = []
 
         component_dir = infra_dir / component
-        component_dir.mkdir(exist_ok=True)
+        os.makedirs(component_dir, exist_ok=True)
 
         template_component_dir = self.template_dir / component
 
-        # Check if template directory exists and has .j2 files
-        has_templates = (template_component_dir.exists() and
-                        list(template_component_dir.glob('*.j2')))
+        # Check if template directory exists and has .j2 files (one directory scan,
+        # reused for rendering below)
+        template_files = (_list_j2(template_component_dir)
+                          if template_component_dir.is_dir() else [])
 
-        if not has_templates:
-            print(f"Warning: No template found for {component}, copying from infra/")
+        if not template_files:
+            logger.warning("Warning: No template found for %s, copying from infra/", component)
             # Copy from existing infra if template doesn't exist
             src_dir = Path('infra') / component
             if src_dir.exists():
                 # Get exclusion list for this component
-                exclude_files = self.EXCLUDE_FILES.get(component, [])
-
-                # Copy .tf files
-                for file in src_dir.glob('*.tf'):
-                    # Skip excluded files
-                    if file.name in exclude_files:
-                        print(f"  Skipping {file.name} (client-specific)")
-                        continue
-                    shutil.copy(file, component_dir)
-                    print(f"  Copied: {file.name}")
+                exclude_files = self.EXCLUDE_FILES.get(component, frozenset())
+                component_dir_str = str(component_dir)
+
+                # Single scandir pass: collect .tf files and additional directories
+                tf_files = []
+                subdirs = []
+                skipped = []
+                with os.scandir(src_dir) as entries:
+                    for entry in sorted(entries, key=lambda e: e.name):
+                        if entry.is_dir():
+                            if not entry.name.startswith('.'):
+                                subdirs.append(entry)
+                        elif entry.name.endswith('.tf'):
+                            # Skip excluded files
+                            if entry.name in exclude_files:
+                                skipped.append(('Skipping', f"{entry.name} (client-specific)"))
+                                continue
+                            tf_files.append(entry)
+
+                # Copy .tf files (I/O-bound, so threads overlap the syscalls)
+                if tf_files:
+                    with ThreadPoolExecutor(
+                        max_workers=min(self.MAX_IO_WORKERS, len(tf_files))
+                    ) as executor:
+                        list(executor.map(
+                            lambda e: _fast_copy_file(
+                                e.path, os.path.join(component_dir_str, e.name)),
+                            tf_files
+                        ))
+                    written.extend(('Copied', entry.name) for entry in tf_files)
+                written.extend(skipped)
 
                 # Copy additional directories (values, files, templates, code, etc.)
-                for subdir in src_dir.iterdir():
-                    if subdir.is_dir() and not subdir.name.startswith('.'):
-                        dest_subdir = component_dir / subdir.name
-                        if dest_subdir.exists():
-                            shutil.rmtree(dest_subdir)
-                        shutil.copytree(subdir, dest_subdir)
-                        print(f"  Copied directory: {subdir.name}/")
-            return
+                for subdir in subdirs:
+                    dest_subdir = os.path.join(component_dir_str, subdir.name)
+                    if os.path.exists(dest_subdir):
+                        import shutil
+                        shutil.rmtree(dest_subdir)
+                    _copy_tree(subdir.path, dest_subdir)
+                    written.append(('Copied directory', f"{subdir.name}/"))
+            return written
 
         # Setup Jinja2 environment (cached for performance)
         env = self._get_jinja_env(template_component_dir)
 
-        # Template context
-        context = {
-            'project_name': self.project_name,
-            'environments': self.environments,
-            'region': self.config.get('region', 'us-east-1'),
-            'aws_account_id': self.config.get('aws_account_id', ''),
-            'aws_profile': self.config.get('aws_profile', 'default'),
-            # Backend configuration (local or S3 with native locking)
-            'backend_type': self.config.get('backend_type', 'local'),
-            'state_bucket': self.config.get('state_bucket', ''),
-            **self.config
-        }
+        # Resolve the output directory once; per-file paths are plain strings
+        component_dir_str = str(component_dir.resolve())
+
+        # Render templates in parallel; results come back in submission order
+        with ThreadPoolExecutor(
+            max_workers=min(self.MAX_IO_WORKERS, len(template_files))
+        ) as executor:
+            written.extend(
+                ('Generated', output_name) for output_name in executor.map(
+                    lambda t: self._render_template(
+                        env, t, component_dir_str, self._template_context),
+                    template_files)
+            )
 
-        # Security: Sanitize template context to prevent SSTI
-        context = SecurityValidator.sanitize_template_context(context)
+        return written
 
-        # Render templates
-        for template_file in template_component_dir.glob('*.j2'):
-            # Security: Validate template filename
-            SecurityValidator.validate_filename(template_file.name)
+    def _render_template(self, env: 'Environment', template_file: os.DirEntry[str],
+                         component_dir: str, context: Mapping[str, Any]) -> str:
+        """
+        Render a single component template and write it to the output directory
 
-            output_file = component_dir / template_file.stem
+        Args:
+            env: Jinja2 environment for the component
+            template_file: Source .j2 template
+            component_dir: Resolved component output directory
+            context: Sanitized template context
 
-            # Security: Validate output path
-            output_file = SecurityValidator.validate_path(
-                output_file.resolve(),
-                base_dir=component_dir.resolve()
-            )
+        Returns:
+            Name of the written file
+        """
+        # Security: Validate template filename
+        SecurityValidator.validate_filename(template_file.name)
+
+        output_name = template_file.name[:-len('.j2')]
+        output_file = os.path.join(component_dir, output_name)
 
-            template = env.get_template(template_file.name)
-            rendered_content = template.render(**context)
+        # Security: Validate output path. The filename has no separators and
+        # component_dir is already resolved, so only an existing symlink at
+        # output_file could point elsewhere; fully resolve just in that case.
+        if os.path.islink(output_file):
+            output_file = str(SecurityValidator.validate_path(
+                Path(output_file).resolve(),
+                base_dir=Path(component_dir)
+            ))
 
-            output_file.write_text(rendered_content, encoding='utf-8')
-            print(f"  Generated: {output_file.name}")
+        template = env.get_template(template_file.name)
+        _write_file(output_file, template.render(context).encode('utf-8'))
+        return output_name
 
     def _generate_ci_config(self, output_dir: Path) -> None:
         """Generate CI/CD configuration based on selected provider"""
-        if self.ci_provider == 'gitlab':
-            self._generate_gitlab_ci(output_dir)
-        elif self.ci_provider == 'github':
-            self._generate_github_actions(output_dir)
-        elif self.ci_provider == 'azuredevops':
-            self._generate_azure_devops(output_dir)
+        if self.ci_provider in self.CI_PROVIDERS:
+            self._render_ci(self.ci_provider, output_dir)
         else:
-            print(f"⚠️  Warning: Unknown CI provider '{self.ci_provider}', skipping CI config generation")
-
-    def _generate_gitlab_ci(self, output_dir: Path) -> None:
-        """Generate GitLab CI/CD configuration from template"""
-        print("🔧 Generating GitLab CI/CD config...")
-
-        # Load template from file instead of hardcoded string
-        gitlab_template_dir = self.template_dir / 'ci-providers' / 'gitlab'
-
-        if not gitlab_template_dir.exists():
-            # Fallback to old location for backward compatibility
-            gitlab_template_dir = self.template_dir / 'gitlab-ci'
-
-        if not gitlab_template_dir.exists():
-            raise FileNotFoundError(
-                f"❌ GitLab CI template directory not found: {gitlab_template_dir}\n"
-                f"   Expected location: template-modules/ci-providers/gitlab/\n"
-                f"   Please ensure the template directory exists."
-            )
+            logger.warning("⚠️  Warning: Unknown CI provider '%s', skipping CI config generation",
+                           self.ci_provider)
 
-        env = Environment(
-            loader=FileSystemLoader(str(gitlab_template_dir)),
-            autoescape=False,
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
-
-        template = env.get_template('gitlab-ci.yml.j2')
-        rendered = template.render(
-            components=self.components,
-            environments=self.environments
-        )
-
-        gitlab_ci_file = output_dir / '.gitlab-ci.yml'
-        gitlab_ci_file.write_text(rendered)
-        print(f"✓ Generated: {gitlab_ci_file}")
+    def _render_ci(self, provider: str, output_dir: Path) -> None:
+        """
+        Generate CI/CD configuration for a provider from its template
 
-        # Validate YAML syntax
-        self._validate_yaml_file(gitlab_ci_file)
+        Args:
+            provider: Key of CI_PROVIDERS
+            output_dir: Output root directory
 
-    def _generate_github_actions(self, output_dir: Path) -> None:
-        """Generate GitHub Actions workflow configuration from template"""
-        print("🔧 Generating GitHub Actions workflow...")
+        Raises:
+            FileNotFoundError: If the provider's template directory is missing
+        """
+        template_subdir, template_name, output_name, display_name = self.CI_PROVIDERS[provider]
+        logger.info("🔧 Generating %s configuration...", display_name)
 
-        github_template_dir = self.template_dir / 'ci-providers' / 'github'
+        template_dir = self.template_dir / template_subdir
+        legacy_subdir = self.CI_LEGACY_TEMPLATE_DIRS.get(provider)
+        if not template_dir.exists() and legacy_subdir:
+            # Fallback to old location for backward compatibility
+            template_dir = self.template_dir / legacy_subdir
 
-        if not github_template_dir.exists():
+        if not template_dir.exists():
             raise FileNotFoundError(
-                f"❌ GitHub Actions template directory not found: {github_template_dir}\n"
-                f"   Expected location: template-modules/ci-providers/github/\n"
+                f"❌ {display_name} template directory not found: {template_dir}\n"
+                f"   Expected location: template-modules/{template_subdir}/\n"
                 f"   Please ensure the template directory exists."
             )
 
-        env = Environment(
-            loader=FileSystemLoader(str(github_template_dir)),
-            autoescape=False,
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        env = self._get_jinja_env(template_dir)
 
-        template = env.get_template('terraform-ci.yml.j2')
+        template = env.get_template(template_name)
         rendered = template.render(
             components=self.components,
             environments=self.environments,
             project_name=self.project_name
         )
 
-        # Create .github/workflows directory
-        workflows_dir = output_dir / '.github' / 'workflows'
-        workflows_dir.mkdir(parents=True, exist_ok=True)
-
-        workflow_file = workflows_dir / 'terraform-ci.yml'
-        workflow_file.write_text(rendered)
-        print(f"✓ Generated: {workflow_file}")
+        # Validate YAML syntax before anything is written
+        ci_file = output_dir / output_name
+        data = rendered.encode('utf-8')
+        self._validate_yaml(data, ci_file)
 
-        # Validate YAML syntax
-        self._validate_yaml_file(workflow_file)
+        # Create parent directories (e.g. .github/workflows)
+        os.makedirs(ci_file.parent, exist_ok=True)
+        _write_file(str(ci_file), data)
+        logger.info("✓ Generated: %s", ci_file)
 
-    def _generate_azure_devops(self, output_dir: Path) -> None:
-        """Generate Azure DevOps pipeline configuration from template"""
-        print("🔧 Generating Azure DevOps pipeline...")
-
-        azure_template_dir = self.template_dir / 'ci-providers' / 'azuredevops'
-
-        if not azure_template_dir.exists():
-            raise FileNotFoundError(
-                f"❌ Azure DevOps template directory not found: {azure_template_dir}\n"
-                f"   Expected location: template-modules/ci-providers/azuredevops/\n"
-                f"   Please ensure the template directory exists."
-            )
-
-        env = Environment(
-            loader=FileSystemLoader(str(azure_template_dir)),
-            autoescape=False,
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+    def _validate_yaml(self, data: bytes, file_path: Path) -> None:
+        """
+        Validate YAML syntax of a rendered CI/CD configuration file
 
-        template = env.get_template('azure-pipelines.yml.j2')
-        rendered = template.render(
-            components=self.components,
-            environments=self.environments
-        )
+        The rendered bytes are safe-loaded in memory, before they are
+        written, using the libyaml C loader when available. Loading (not just
+        parsing) also catches undefined aliases and unsupported tags.
 
-        azure_pipeline_file = output_dir / 'azure-pipelines.yml'
-        azure_pipeline_file.write_text(rendered)
-        print(f"✓ Generated: {azure_pipeline_file}")
+        Args:
+            data: Rendered file content
+            file_path: Destination path, used in messages
 
-        # Validate YAML syntax
-        self._validate_yaml_file(azure_pipeline_file)
+        Raises:
+            ValueError: If the content is not well-formed YAML
+        """
+        loader = _get_yaml_loader()
+        if loader is None:
+            logger.warning("⚠️  Warning: PyYAML not installed, skipping YAML validation\n"
+                           "   Install with: pip install pyyaml")
+            return
 
-    def _validate_yaml_file(self, file_path: Path) -> None:
-        """Validate YAML syntax of generated CI/CD configuration file"""
+        import yaml
         try:
-            import yaml
-            with open(file_path, 'r') as f:
-                yaml.safe_load(f)
-            print(f"✓ YAML validation passed: {file_path.name}")
-        except ImportError:
-            print(f"⚠️  Warning: PyYAML not installed, skipping YAML validation")
-            print(f"   Install with: pip install pyyaml")
+            yaml.load(data, Loader=loader)
         except yaml.YAMLError as e:
             raise ValueError(
                 f"❌ YAML syntax error in {file_path}:\n"
                 f"   {str(e)}\n"
                 f"   Please check the template and regenerate."
             )
+        logger.info("✓ YAML validation passed: %s", file_path.name)
 
     def _generate_config_structure(self, output_dir: Path) -> None:
         """Generate config directory structure with sample tfvars"""
-        print("⚙️  Generating config structure...")
+        logger.info("⚙️  Generating config structure...")
 
         config_dir = output_dir / 'infra' / 'config'
-        config_dir.mkdir(parents=True, exist_ok=True)
-
-        sample_tfvars = f"""# Sample configuration for {{{{ env }}}}
-env     = "{{{{ env }}}}"
-account = "YOUR_AWS_ACCOUNT_ID"
-region  = "{self.config.get('region', 'us-east-1')}"
-
-# Add additional variables as needed
-"""
-
-        readme = """# Configuration Files
-
-This directory should contain environment-specific `.tfvars` files:
-- `dev.tfvars`
-- `uat.tfvars`
-- `prod.tfvars`
-
-These files are gitignored and should contain sensitive configuration values.
-
-## Example
-
-```hcl
-env     = "dev"
-account = "123456789012"
-region  = "us-east-1"
-dns     = "example.com"
-```
-"""
-
-        (config_dir / 'README.md').write_text(readme)
-        (config_dir / 'sample.tfvars.example').write_text(sample_tfvars)
-        print(f"✓ Generated config templates in {config_dir}")
+        os.makedirs(config_dir, exist_ok=True)
+
+        _write_file(str(config_dir / 'README.md'), _CONFIG_README.encode('utf-8'))
+        _write_file(
+            str(config_dir / 'sample.tfvars.example'),
+            _SAMPLE_TFVARS_TEMPLATE.format_map(
+                {'region': self.config.get('region', 'us-east-1')}
+            ).encode('utf-8')
+        )
+        logger.info("✓ Generated config templates in %s", config_dir)
 
     def _generate_readme(self, output_dir: Path) -> None:
-        """Generate README with instructions"""
-        print("📄 Generating README...")
-        readme = f"""# {self.project_name} Infrastructure
-
-Generated Terraform infrastructure using template generator.
-
-## Components
-
-{chr(10).join(f'- {c}' for c in self.components)}
-
-## Environments
-
-{chr(10).join(f'- {e}' for e in self.environments)}
-
-## Prerequisites
-
-- Terraform >= 1.2.0
-- AWS CLI configured
-- GitLab CI/CD (optional)
-
-## Directory Structure
-
-```
-infra/
-{chr(10).join(f'  {c}/' for c in self.components)}
-  config/  # Environment-specific .tfvars files (gitignored)
-```
-
-## Usage
-
-### 1. Configure Environment Variables
-
-Create `.tfvars` files in `infra/config/`:
-
-```bash
-cp infra/config/sample.tfvars.example infra/config/dev.tfvars
-# Edit dev.tfvars with your values
-```
-
-### 2. Initialize Terraform
-
-```bash
-cd infra/<component>
-terraform init
-```
-
-### 3. Plan Changes
-
-```bash
-terraform plan -var-file=../config/${{ENV}}.tfvars
-```
-
-### 4. Apply Changes
-
-```bash
-terraform apply -var-file=../config/${{ENV}}.tfvars
-```
-
-## Deployment Order
-
-Components must be deployed in this order due to dependencies:
-
-{chr(10).join(f'{i+1}. {c}' for i, c in enumerate(self.components))}
-
-## GitLab CI/CD
-
-The repository includes a `.gitlab-ci.yml` file that automates:
-- **Validate**: Runs fmt and validate checks
-- **Plan**: Creates execution plans per environment
-- **Apply**: Manual approval required on main branch
-
-## Configuration
-
-Backend Type: **{self.config.get('backend_type', 'local').upper()}**
-- **State Storage**: {'S3 (' + self.config.get('state_bucket', '') + ')' if self.config.get('backend_type') == 's3' else 'Local (terraform.tfstate in each component directory)'}
-- **State Locking**: {'S3 Native (Terraform 1.10+)' if self.config.get('backend_type') == 's3' else 'None (local backend only)'}
-- **Region**: `{self.config.get('region', 'us-east-1')}`
-- **AWS Account**: `{self.config.get('aws_account_id', 'TBD')}`
-"""
-
-        # Add backend-specific section
-        if self.config.get('backend_type') == 's3':
-            readme += """
-### S3 Backend Migration
-
-If migrating from local to S3 backend, use the provided helper script:
-
-```bash
-./scripts/migrate-to-s3-backend.sh <component> <environment>
-# Example: ./scripts/migrate-to-s3-backend.sh vpc dev
-```
-"""
-        else:
-            readme += """
-**Note**: For production use, consider migrating to S3 backend with native state locking (Terraform 1.10+).
-"""
-
-        readme += """
-
-## VPC Flow Logs
+        """
+        Generate README with instructions from <template_dir>/readme/
 
-VPC Flow Logs are **enabled by default** for production use.
+        Falls back to the packaged template-modules/readme/ when a custom
+        template_dir does not provide its own README template.
+        """
+        logger.info("📄 Generating README...")
 
-For local testing with limited IAM permissions (e.g., AWS Contributor role), disable Flow Logs:
+        readme_template_dir = self.template_dir / 'readme'
+        if not (readme_template_dir / 'README.md.j2').is_file():
+            readme_template_dir = PACKAGED_TEMPLATE_DIR / 'readme'
+        if not (readme_template_dir / 'README.md.j2').is_file():
+            raise FileNotFoundError(
+                f"❌ README template not found: {readme_template_dir / 'README.md.j2'}\n"
+                f"   Expected location: template-modules/readme/\n"
+                f"   Please ensure the template directory exists."
+            )
 
-```bash
-# Add to your .tfvars file:
-enable_flow_logs = false
-```
+        env = self._get_jinja_env(readme_template_dir)
 
-**Note**: Flow Logs require permissions to create IAM roles and CloudWatch Log Groups. Disable this setting if testing locally with limited permissions.
-"""
+        template = env.get_template('README.md.j2')
+        readme = template.render(
+            project_name=self.project_name,
+            components=self.components,
+            environments=self.environments,
+            backend_type=self.config.get('backend_type', 'local'),
+            state_bucket=self.config.get('state_bucket', ''),
+            region=self.config.get('region', 'us-east-1'),
+            aws_account_id=self.config.get('aws_account_id', 'TBD')
+        )
 
-        (output_dir / 'README.md').write_text(readme)
-        print(f"✓ Generated: README.md with deployment instructions")
+        os.makedirs(output_dir, exist_ok=True)
+        _write_file(str(output_dir / 'README.md'), readme.encode('utf-8'))
+        logger.info("✓ Generated: README.md with deployment instructions")
 
     def _generate_backend_scripts(self, output_dir: Path) -> None:
         """Generate helper scripts for S3 backend management"""
-        print("🔧 Generating backend helper scripts...")
+        logger.info("🔧 Generating backend helper scripts...")
 
         scripts_dir = output_dir / 'scripts'
-        scripts_dir.mkdir(exist_ok=True)
-
-        # Migration script
-        migration_script = f"""#!/bin/bash
-# Migrate Terraform component from local to S3 backend
-#
-# Usage: ./scripts/migrate-to-s3-backend.sh <component> <environment>
-# Example: ./scripts/migrate-to-s3-backend.sh vpc dev
-
-set -e
-
-COMPONENT=$1
-ENV=$2
+        os.makedirs(scripts_dir, exist_ok=True)
 
-if [ -z "$COMPONENT" ] || [ -z "$ENV" ]; then
-    echo "Usage: $0 <component> <environment>"
-    echo "Example: $0 vpc dev"
-    exit 1
-fi
-
-COMPONENT_DIR="infra/$COMPONENT"
-
-if [ ! -d "$COMPONENT_DIR" ]; then
-    echo "❌ Error: Component directory not found: $COMPONENT_DIR"
-    exit 1
-fi
-
-echo "🔄 Migrating $COMPONENT ($ENV) to S3 backend..."
-echo ""
-echo "Backend configuration:"
-echo "  Bucket: {self.config.get('state_bucket', 'BUCKET_NAME')}"
-echo "  Key: $ENV/$COMPONENT/terraform.tfstate"
-echo "  Locking: S3 Native (Terraform 1.10+)"
-echo "  Region: {self.config.get('region', 'us-east-1')}"
-echo ""
-
-cd "$COMPONENT_DIR"
-
-# Reinitialize with backend config
-terraform init \\
-  -migrate-state \\
-  -backend-config="key=$ENV/$COMPONENT/terraform.tfstate"
-
-echo "✅ Migration complete!"
-echo ""
-echo "Verify state in S3:"
-echo "  aws s3 ls s3://{self.config.get('state_bucket', 'BUCKET_NAME')}/$ENV/$COMPONENT/"
-"""
-
-        migration_script_path = scripts_dir / 'migrate-to-s3-backend.sh'
-        migration_script_path.write_text(migration_script)
-        migration_script_path.chmod(0o755)
-        print(f"✓ Generated: scripts/migrate-to-s3-backend.sh")
-
-        # Backend init script
-        init_script = f"""#!/bin/bash
-# Initialize Terraform with S3 backend configuration
-#
-# Usage: ./scripts/init-backend.sh <component> <environment>
-# Example: ./scripts/init-backend.sh vpc dev
-
-set -e
-
-COMPONENT=$1
-ENV=$2
-
-if [ -z "$COMPONENT" ] || [ -z "$ENV" ]; then
-    echo "Usage: $0 <component> <environment>"
-    echo "Example: $0 vpc dev"
-    exit 1
-fi
-
-COMPONENT_DIR="infra/$COMPONENT"
-
-if [ ! -d "$COMPONENT_DIR" ]; then
-    echo "❌ Error: Component directory not found: $COMPONENT_DIR"
-    exit 1
-fi
-
-echo "🔧 Initializing $COMPONENT ($ENV) with S3 backend..."
-
-cd "$COMPONENT_DIR"
-
-terraform init \\
-  -backend-config="key=$ENV/$COMPONENT/terraform.tfstate"
+        script_values = {
+            'state_bucket': self.config.get('state_bucket', 'BUCKET_NAME'),
+            'region': self.config.get('region', 'us-east-1'),
+        }
 
-echo "✅ Initialization complete!"
-"""
+        # Executable mode is set on the file before it is moved into place
+        for name, template in _BACKEND_SCRIPTS:
+            _write_file(
+                os.path.join(scripts_dir, name),
+                template.format_map(script_values).encode('utf-8'),
+                mode=0o755
+            )
+            logger.info("✓ Generated: scripts/%s", name)
 
-        init_script_path = scripts_dir / 'init-backend.sh'
-        init_script_path.write_text(init_script)
-        init_script_path.chmod(0o755)
-        print(f"✓ Generated: scripts/init-backend.sh")
 
-        # Backend validation script
-        validate_script = f"""#!/bin/bash
-# Validate S3 backend configuration
-#
-# Usage: ./scripts/validate-backend.sh
+def _csv_list(value: str) -> List[str]:
+    """argparse type: split a comma-separated value into a list of stripped items"""
+    items = [item.strip() for item in value.split(',')]
+    if not all(items):
+        raise argparse.ArgumentTypeError(f"empty item in comma-separated list: '{value}'")
+    return items
 
-set -e
 
-BUCKET="{self.config.get('state_bucket', 'BUCKET_NAME')}"
-REGION="{self.config.get('region', 'us-east-1')}"
+def _parse_vpc_cidrs(value: str) -> Dict[str, Any]:
+    """
+    Parse the --vpc-cidrs JSON object
 
-echo "🔍 Validating S3 backend configuration..."
-echo ""
-
-# Check S3 bucket
-echo "Checking S3 bucket: $BUCKET"
-if aws s3 ls "s3://$BUCKET" --region "$REGION" >/dev/null 2>&1; then
-    echo "  ✅ S3 bucket exists and is accessible"
-
-    # Check versioning
-    VERSIONING=$(aws s3api get-bucket-versioning --bucket "$BUCKET" --region "$REGION" --query 'Status' --output text 2>/dev/null || echo "None")
-    if [ "$VERSIONING" = "Enabled" ]; then
-        echo "  ✅ Versioning is enabled"
-    else
-        echo "  ⚠️  Warning: Versioning is not enabled"
-    fi
-
-    # Check encryption
-    ENCRYPTION=$(aws s3api get-bucket-encryption --bucket "$BUCKET" --region "$REGION" 2>/dev/null && echo "Enabled" || echo "Disabled")
-    if [ "$ENCRYPTION" = "Enabled" ]; then
-        echo "  ✅ Encryption is enabled"
-    else
-        echo "  ⚠️  Warning: Encryption is not enabled"
-    fi
-else
-    echo "  ❌ S3 bucket does not exist or is not accessible"
-    exit 1
-fi
-
-echo ""
-echo "✅ S3 backend configuration is valid!"
-echo ""
-echo "Note: Using S3 native state locking (Terraform 1.10+)"
-echo ""
-echo "✅ Backend validation complete!"
-"""
-
-        validate_script_path = scripts_dir / 'validate-backend.sh'
-        validate_script_path.write_text(validate_script)
-        validate_script_path.chmod(0o755)
-        print(f"✓ Generated: scripts/validate-backend.sh")
+    Invalid input is reported and ignored, so the template defaults apply.
+    """
+    try:
+        parsed = json.loads(value)
+    except json.JSONDecodeError:
+        parsed = None
+    if not isinstance(parsed, dict):
+        logger.warning("⚠️  Warning: Invalid JSON for vpc-cidrs, using defaults")
+        return {}
+    return parsed
 
 
 def main() -> None:
@@ -772,11 +1060,13 @@ def main() -> None:
     parser.add_argument(
         '--components',
         required=True,
+        type=_csv_list,
         help='Comma-separated list of components (vpc,rds,eks,services,etc)'
     )
     parser.add_argument(
         '--environments',
         default='dev,uat,prod',
+        type=_csv_list,
         help='Comma-separated list of environments (default: dev,uat,prod)'
     )
     parser.add_argument(
@@ -810,7 +1100,7 @@ def main() -> None:
     parser.add_argument(
         '--ci-provider',
         default='gitlab',
-        choices=['gitlab', 'github', 'azuredevops'],
+        choices=sorted(InfrastructureGenerator.CI_PROVIDERS),
         help='CI/CD provider (default: gitlab)'
     )
     parser.add_argument(
@@ -822,6 +1112,7 @@ def main() -> None:
     )
     parser.add_argument(
         '--vpc-cidrs',
+        default='',
         help='VPC CIDRs per environment as JSON string (e.g., \'{"dev":"10.0.0.0/16","prod":"10.2.0.0/16"}\')'
     )
     parser.add_argument(
@@ -834,12 +1125,27 @@ def main() -> None:
         '--state-bucket',
         help='S3 bucket name for Terraform state (required if backend-type=s3). Example: my-project-terraform-state-123456789012'
     )
+    parser.add_argument(
+        '--clear-template-cache',
+        action='store_true',
+        help='Remove compiled templates cached by previous runs before generating'
+    )
+    parser.add_argument(
+        '--quiet', '-q',
+        action='store_true',
+        help='Only print warnings and errors'
+    )
 
     args = parser.parse_args()
 
-    # Parse components and environments
-    components = [c.strip() for c in args.components.split(',')]
-    environments = [e.strip() for e in args.environments.split(',')]
+    logging.basicConfig(
+        format='%(message)s',
+        stream=sys.stdout,
+        level=logging.WARNING if args.quiet else logging.INFO
+    )
+
+    if args.clear_template_cache:
+        _clear_template_cache()
 
     # Load additional config
     config = {}
@@ -847,26 +1153,20 @@ def main() -> None:
         with open(args.config) as f:
             config = json.load(f)
 
-    # Parse VPC CIDRs if provided
-    vpc_cidrs = {}
-    if args.vpc_cidrs:
-        try:
-            vpc_cidrs = json.loads(args.vpc_cidrs)
-        except json.JSONDecodeError:
-            print(f"⚠️  Warning: Invalid JSON for vpc-cidrs, using defaults")
-
     # Validate backend configuration
     backend_type = args.backend_type or config.get('backend_type', 'local')
     if backend_type == 's3':
         state_bucket = args.state_bucket or config.get('state_bucket', '')
 
         if not state_bucket:
-            print("❌ Error: --state-bucket is required when --backend-type=s3")
-            print("\nTip: First deploy the terraform-backend component to create the S3 bucket:")
-            print("  python3 scripts/generators/generate_infrastructure.py \\")
-            print("    --project-name my-project \\")
-            print("    --components terraform-backend \\")
-            print("    --environments dev")
+            logger.error(
+                "❌ Error: --state-bucket is required when --backend-type=s3\n"
+                "\nTip: First deploy the terraform-backend component to create the S3 bucket:\n"
+                "  python3 scripts/generators/generate_infrastructure.py \\\n"
+                "    --project-name my-project \\\n"
+                "    --components terraform-backend \\\n"
+                "    --environments dev"
+            )
             sys.exit(1)
     else:
         state_bucket = ''
@@ -880,7 +1180,7 @@ def main() -> None:
         'repository': args.repository or config.get('repository', 'infrastructure-accelerator'),
         'ci_provider': args.ci_provider or config.get('ci_provider', 'gitlab'),
         'availability_zones': args.availability_zones,
-        'vpc_cidrs': vpc_cidrs,
+        'vpc_cidrs': _parse_vpc_cidrs(args.vpc_cidrs) if args.vpc_cidrs else {},
         'backend_type': backend_type,
         'state_bucket': state_bucket,
     })
@@ -888,20 +1188,23 @@ def main() -> None:
     # Generate infrastructure
     generator = InfrastructureGenerator(
         project_name=args.project_name,
-        components=components,
-        environments=environments,
+        components=args.components,
+        environments=args.environments,
         config=config
     )
 
     generator.validate_components()
     generator.generate()
 
-    print("\n✅ Infrastructure generation complete!")
-    print(f"📁 Output directory: {args.output_dir}")
-    print("\nNext steps:")
-    print("1. Review generated files")
-    print("2. Create config/*.tfvars files with your values")
-    print("3. Initialize and apply Terraform")
+    logger.info(
+        "\n✅ Infrastructure generation complete!\n"
+        "📁 Output directory: %s\n"
+        "\nNext steps:\n"
+        "1. Review generated files\n"
+        "2. Create config/*.tfvars files with your values\n"
+        "3. Initialize and apply Terraform",
+        args.output_dir
+    )
 
 
 if __name__ == '__main__':
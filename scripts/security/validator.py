@@ -6,11 +6,26 @@ Provides input sanitization, path validation, and security checks
 
 import re
 import os
+import time
+import functools
+from collections import deque
 from pathlib import Path
-from typing import List, Optional
+from typing import Deque, List, Optional, Tuple
 import unicodedata
 
 
+def _normalize(value: str) -> str:
+    """
+    NFKC-normalize, strip and lowercase an identifier
+
+    ASCII input is already NFKC-normalized, so the Unicode tables are only
+    consulted for non-ASCII strings.
+    """
+    if not value.isascii():
+        value = unicodedata.normalize('NFKC', value)
+    return value.strip().lower()
+
+
 class SecurityValidator:
     """Security validation and sanitization utilities"""
 
@@ -18,16 +33,33 @@ class SecurityValidator:
     PROJECT_NAME_PATTERN = re.compile(r'^[a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?$')
     COMPONENT_PATTERN = re.compile(r'^[a-z]([a-z0-9-]*[a-z0-9])?$')
     ENV_PATTERN = re.compile(r'^[a-z]([a-z0-9-]*[a-z0-9])?$')
-    AWS_ACCOUNT_ID_PATTERN = re.compile(r'^\d{12}$')
     AWS_REGION_PATTERN = re.compile(r'^[a-z]{2}-[a-z]+-\d{1}$')
 
-    # Allowed AWS regions
-    ALLOWED_REGIONS = {
+    # Performance: pre-bound match methods (no pattern attribute lookup per call)
+    _PROJECT_NAME_MATCH = PROJECT_NAME_PATTERN.match
+    _COMPONENT_MATCH = COMPONENT_PATTERN.match
+    _ENV_MATCH = ENV_PATTERN.match
+
+    # Path traversal, separators and ASCII control characters (including NUL)
+    # in a filename, found with one C-level scan
+    _BAD_FILENAME_SEARCH = re.compile(r'\.\.|[/\\\x00-\x1f]').search
+
+    # Allowed AWS regions (immutable, O(1) membership)
+    ALLOWED_REGIONS = frozenset({
         'us-east-1', 'us-east-2', 'us-west-1', 'us-west-2',
         'eu-west-1', 'eu-west-2', 'eu-west-3', 'eu-central-1',
         'ap-southeast-1', 'ap-southeast-2', 'ap-northeast-1',
         'ca-central-1', 'sa-east-1'
-    }
+    })
+
+    # Pre-joined for error messages
+    _ALLOWED_REGIONS_TEXT = ', '.join(sorted(ALLOWED_REGIONS))
+
+    # Reserved project names (excluding 'test' for CI/testing purposes)
+    RESERVED_PROJECT_NAMES = frozenset({'tmp', 'temp', 'admin', 'root', 'default'})
+
+    # Placeholder/documentation account IDs rejected as obviously fake
+    FAKE_ACCOUNT_IDS = frozenset({'000000000000', '123456789012'})
 
     # Maximum lengths to prevent DoS
     MAX_PROJECT_NAME_LENGTH = 63
@@ -35,6 +67,10 @@ class SecurityValidator:
     MAX_PATH_LENGTH = 4096
     MAX_COMPONENTS_COUNT = 20
 
+    # Raw inputs longer than max length * factor are rejected before any
+    # normalization or path resolution (leaves room for whitespace and NFKC)
+    RAW_LENGTH_SLACK_FACTOR = 4
+
     @classmethod
     def validate_project_name(cls, name: str) -> str:
         """
@@ -47,24 +83,28 @@ class SecurityValidator:
         if not name:
             raise ValueError("Project name cannot be empty")
 
+        too_long = f"Project name too long (max {cls.MAX_PROJECT_NAME_LENGTH} chars)"
+
+        # Cheap rejection of oversized input before normalizing it
+        if len(name) > cls.MAX_PROJECT_NAME_LENGTH * cls.RAW_LENGTH_SLACK_FACTOR:
+            raise ValueError(too_long)
+
         # Normalize unicode and strip whitespace
-        name = unicodedata.normalize('NFKC', name).strip().lower()
+        name = _normalize(name)
 
         # Check length
         if len(name) > cls.MAX_PROJECT_NAME_LENGTH:
-            raise ValueError(
-                f"Project name too long (max {cls.MAX_PROJECT_NAME_LENGTH} chars)"
-            )
+            raise ValueError(too_long)
 
         # Validate pattern
-        if not cls.PROJECT_NAME_PATTERN.match(name):
+        if not cls._PROJECT_NAME_MATCH(name):
             raise ValueError(
                 "Project name must be lowercase alphanumeric, "
                 "start/end with alphanumeric, and may contain hyphens"
             )
 
-        # Prevent reserved names (excluding 'test' for CI/testing purposes)
-        if name in ['tmp', 'temp', 'admin', 'root', 'default']:
+        # Prevent reserved names
+        if name in cls.RESERVED_PROJECT_NAMES:
             raise ValueError(f"Project name '{name}' is reserved")
 
         return name
@@ -80,14 +120,17 @@ class SecurityValidator:
         if not component:
             raise ValueError("Component name cannot be empty")
 
-        component = unicodedata.normalize('NFKC', component).strip().lower()
+        too_long = f"Component name too long (max {cls.MAX_COMPONENT_NAME_LENGTH} chars)"
+
+        if len(component) > cls.MAX_COMPONENT_NAME_LENGTH * cls.RAW_LENGTH_SLACK_FACTOR:
+            raise ValueError(too_long)
+
+        component = _normalize(component)
 
         if len(component) > cls.MAX_COMPONENT_NAME_LENGTH:
-            raise ValueError(
-                f"Component name too long (max {cls.MAX_COMPONENT_NAME_LENGTH} chars)"
-            )
+            raise ValueError(too_long)
 
-        if not cls.COMPONENT_PATTERN.match(component):
+        if not cls._COMPONENT_MATCH(component):
             raise ValueError(
                 f"Invalid component name: {component}. "
                 "Must be lowercase alphanumeric with hyphens"
@@ -111,11 +154,8 @@ class SecurityValidator:
                 f"Too many components (max {cls.MAX_COMPONENTS_COUNT})"
             )
 
-        validated = []
-        for comp in components:
-            validated.append(cls.validate_component(comp))
-
-        return validated
+        validate_component = cls.validate_component
+        return [validate_component(comp) for comp in components]
 
     @classmethod
     def validate_environment(cls, env: str) -> str:
@@ -128,9 +168,9 @@ class SecurityValidator:
         if not env:
             raise ValueError("Environment name cannot be empty")
 
-        env = unicodedata.normalize('NFKC', env).strip().lower()
+        env = _normalize(env)
 
-        if not cls.ENV_PATTERN.match(env):
+        if not cls._ENV_MATCH(env):
             raise ValueError(
                 f"Invalid environment name: {env}. "
                 "Must be lowercase alphanumeric with hyphens"
@@ -151,13 +191,16 @@ class SecurityValidator:
 
         account_id = account_id.strip()
 
-        if not cls.AWS_ACCOUNT_ID_PATTERN.match(account_id):
+        # Plain string checks instead of a regex; isascii() keeps out
+        # non-ASCII Unicode digits that isdigit() would accept
+        if not (len(account_id) == 12 and account_id.isascii()
+                and account_id.isdigit()):
             raise ValueError(
                 "AWS Account ID must be exactly 12 digits"
             )
 
         # Prevent obviously fake IDs
-        if account_id == '000000000000' or account_id == '123456789012':
+        if account_id in cls.FAKE_ACCOUNT_IDS:
             raise ValueError(
                 "Please provide a valid AWS Account ID"
             )
@@ -180,7 +223,7 @@ class SecurityValidator:
         if region not in cls.ALLOWED_REGIONS:
             raise ValueError(
                 f"Invalid AWS region: {region}. "
-                f"Allowed regions: {', '.join(sorted(cls.ALLOWED_REGIONS))}"
+                f"Allowed regions: {cls._ALLOWED_REGIONS_TEXT}"
             )
 
         return region
@@ -198,6 +241,15 @@ class SecurityValidator:
             ValueError: If path is invalid or outside base directory
         """
         try:
+            # Cheap string checks first, before touching the filesystem
+            path_str = str(path)
+            if len(path_str) > cls.MAX_PATH_LENGTH * cls.RAW_LENGTH_SLACK_FACTOR:
+                raise ValueError(f"Path too long (max {cls.MAX_PATH_LENGTH} chars)")
+
+            # Check for null bytes
+            if '\x00' in path_str:
+                raise ValueError("Path contains null byte")
+
             # Resolve to absolute path
             resolved = path.resolve()
 
@@ -205,10 +257,6 @@ class SecurityValidator:
             if len(str(resolved)) > cls.MAX_PATH_LENGTH:
                 raise ValueError(f"Path too long (max {cls.MAX_PATH_LENGTH} chars)")
 
-            # Check for null bytes
-            if '\x00' in str(path):
-                raise ValueError("Path contains null byte")
-
             # If base_dir provided, ensure path is within it
             if base_dir:
                 base_resolved = base_dir.resolve()
@@ -238,14 +286,15 @@ class SecurityValidator:
         sanitized = {}
 
         for key, value in context.items():
-            # Skip dangerous keys
-            if key.startswith('_') or key in ['__builtins__', '__globals__']:
+            # Skip private and dunder keys (covers __builtins__, __globals__)
+            if key.startswith('_'):
                 continue
 
             # Sanitize string values
             if isinstance(value, str):
-                # Remove null bytes
-                value = value.replace('\x00', '')
+                # Remove null bytes (the 'in' scan avoids copying clean strings)
+                if '\x00' in value:
+                    value = value.replace('\x00', '')
                 # Limit length
                 if len(value) > 10000:
                     value = value[:10000]
@@ -254,44 +303,45 @@ class SecurityValidator:
             elif isinstance(value, dict):
                 value = cls.sanitize_template_context(value)
 
-            # Sanitize lists
+            # Sanitize lists (always a new list, rebuilt only if an item has a null byte)
             elif isinstance(value, list):
-                value = [
-                    v.replace('\x00', '') if isinstance(v, str) else v
-                    for v in value
-                ]
+                if any(isinstance(v, str) and '\x00' in v for v in value):
+                    value = [
+                        v.replace('\x00', '') if isinstance(v, str) else v
+                        for v in value
+                    ]
+                else:
+                    value = list(value)
 
             sanitized[key] = value
 
         return sanitized
 
     @classmethod
+    @functools.lru_cache(maxsize=2048)
     def validate_filename(cls, filename: str) -> str:
         """
         Validate filename to prevent malicious filenames
 
+        Results are memoized: the check is a pure function of the name.
+
         Raises:
             ValueError: If filename is invalid
         """
         if not filename:
             raise ValueError("Filename cannot be empty")
 
-        # Check for path traversal
-        if '..' in filename or '/' in filename or '\\' in filename:
-            raise ValueError("Filename cannot contain path separators")
-
-        # Check for null bytes
-        if '\x00' in filename:
-            raise ValueError("Filename contains null byte")
-
-        # Check for control characters
-        if any(ord(c) < 32 for c in filename):
-            raise ValueError("Filename contains control characters")
-
         # Validate reasonable length
         if len(filename) > 255:
             raise ValueError("Filename too long (max 255 chars)")
 
+        # Check for path traversal and control characters in a single pass
+        bad = cls._BAD_FILENAME_SEARCH(filename)
+        if bad:
+            if bad.group() in ('..', '/', '\\'):
+                raise ValueError("Filename cannot contain path separators")
+            raise ValueError("Filename contains control characters")
+
         return filename
 
 
@@ -308,7 +358,8 @@ class RateLimiter:
         """
         self.max_operations = max_operations
         self.time_window = time_window
-        self.operations = []
+        # Timestamps of recorded operations, oldest first
+        self.operations: Deque[float] = deque()
 
     def check_rate_limit(self) -> bool:
         """
@@ -317,24 +368,44 @@ class RateLimiter:
         Returns:
             True if within limit, False otherwise
         """
-        import time
-        current_time = time.time()
+        # Monotonic clock keeps timestamps ordered even if wall time jumps
+        current_time = time.monotonic()
+        operations = self.operations
 
-        # Remove old operations outside time window
-        self.operations = [
-            op_time for op_time in self.operations
-            if current_time - op_time < self.time_window
-        ]
+        # Remove old operations outside time window (oldest are at the left)
+        cutoff = current_time - self.time_window
+        while operations and operations[0] <= cutoff:
+            operations.popleft()
 
         # Check limit
-        if len(self.operations) >= self.max_operations:
+        if len(operations) >= self.max_operations:
             return False
 
         # Record operation
-        self.operations.append(current_time)
+        operations.append(current_time)
         return True
 
 
+@functools.lru_cache(maxsize=256)
+def _validate_all_inputs_cached(
+    project_name: str,
+    components: Tuple[str, ...],
+    environments: Tuple[str, ...],
+    region: str,
+    aws_account_id: str
+) -> Tuple[str, Tuple[str, ...], Tuple[str, ...], str, str]:
+    """Validate hashable inputs; memoized backend of validate_all_inputs"""
+    validate_environment = SecurityValidator.validate_environment
+
+    return (
+        SecurityValidator.validate_project_name(project_name),
+        tuple(SecurityValidator.validate_components_list(list(components))),
+        tuple([validate_environment(env) for env in environments]),
+        SecurityValidator.validate_aws_region(region),
+        SecurityValidator.validate_aws_account_id(aws_account_id)
+    )
+
+
 def validate_all_inputs(
     project_name: str,
     components: List[str],
@@ -345,20 +416,26 @@ def validate_all_inputs(
     """
     Validate all inputs for infrastructure generation
 
+    Validation is memoized per distinct set of inputs; every call still
+    returns fresh lists that the caller may modify.
+
     Returns:
         Dictionary with validated inputs
 
     Raises:
         ValueError: If any input is invalid
     """
-    validator = SecurityValidator()
+    project_name, components_key, environments_key, region, aws_account_id = (
+        _validate_all_inputs_cached(
+            project_name, tuple(components), tuple(environments),
+            region, aws_account_id
+        )
+    )
 
     return {
-        'project_name': validator.validate_project_name(project_name),
-        'components': validator.validate_components_list(components),
-        'environments': [
-            validator.validate_environment(env) for env in environments
-        ],
-        'region': validator.validate_aws_region(region),
-        'aws_account_id': validator.validate_aws_account_id(aws_account_id)
+        'project_name': project_name,
+        'components': list(components_key),
+        'environments': list(environments_key),
+        'region': region,
+        'aws_account_id': aws_account_id
     }
@@ -5,6 +5,7 @@ Tests infrastructure code generation and templates
 """
 
 import unittest
+import argparse
 import sys
 import tempfile
 import shutil
@@ -16,7 +17,26 @@ from unittest import mock
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
 
-from generators.generate_infrastructure import InfrastructureGenerator
+from generators.generate_infrastructure import (
+    InfrastructureGenerator,
+    _csv_list,
+    _fast_copy_file,
+    _get_bytecode_cache,
+    _parse_vpc_cidrs,
+    _write_file
+)
+
+
+def isolate_template_cache(test_case):
+    """Point the Jinja2 bytecode cache at a per-test temp dir and reset cached environments"""
+    cache_dir = tempfile.mkdtemp()
+    test_case.addCleanup(shutil.rmtree, cache_dir, ignore_errors=True)
+    env_patch = mock.patch.dict(os.environ, {'INFRA_JINJA_CACHE': cache_dir})
+    env_patch.start()
+    test_case.addCleanup(env_patch.stop)
+    for reset in (_get_bytecode_cache.cache_clear, InfrastructureGenerator._JINJA_ENV_CACHE.clear):
+        reset()
+        test_case.addCleanup(reset)
 
 
 class TestInfrastructureGenerator(unittest.TestCase):
@@ -26,6 +46,7 @@ class TestInfrastructureGenerator(unittest.TestCase):
         """Set up test fixtures"""
         self.temp_dir = tempfile.mkdtemp()
         self.output_dir = Path(self.temp_dir) / 'output'
+        isolate_template_cache(self)
 
     def tearDown(self):
         """Clean up test fixtures"""
@@ -161,11 +182,18 @@ class TestInfrastructureGenerator(unittest.TestCase):
         )
 
         # eks-auto depends on vpc, so vpc should come first
-        sorted_components = generator._sort_by_dependencies(['eks-auto', 'vpc'])
+        sorted_components = generator._resolve(['eks-auto', 'vpc'])
 
         # vpc should be in the list (dependencies handled)
         self.assertIn('vpc', sorted_components)
         self.assertIn('eks-auto', sorted_components)
+        self.assertEqual(sorted_components, ['vpc', 'eks-auto'])
+
+        # Missing dependencies are added once and ordered first
+        self.assertEqual(
+            generator._resolve(['eks-auto', 'rds', 'eks-auto']),
+            ['vpc', 'eks-auto', 'rds']
+        )
 
     def test_check_modules_needed(self):
         """Test modules detection"""
@@ -207,6 +235,44 @@ class TestInfrastructureGenerator(unittest.TestCase):
         # Should be same cached object
         self.assertIs(env1, env2)
 
+        # Cache is shared across generator instances
+        other = InfrastructureGenerator(
+            project_name='otherproject',
+            components=['vpc'],
+            environments=['dev'],
+            config={
+                'output_dir': str(self.output_dir),
+                'region': 'us-east-1',
+                'aws_account_id': '123456789000'
+            }
+        )
+        self.assertIs(other._get_jinja_env(template_dir), env1)
+
+    def test_jinja_env_no_html_escaping_for_hcl(self):
+        """Test HCL templates are rendered without HTML escaping"""
+        generator = InfrastructureGenerator(
+            project_name='myproject',
+            components=['vpc'],
+            environments=['dev'],
+            config={
+                'output_dir': str(self.output_dir),
+                'region': 'us-east-1',
+                'aws_account_id': '123456789000'
+            }
+        )
+
+        template_dir = Path(self.temp_dir) / 'hcl-templates'
+        template_dir.mkdir()
+        (template_dir / 'main.tf.j2').write_text('name = "{{ value }}"')
+        (template_dir / 'page.html').write_text('{{ value }}')
+
+        env = generator._get_jinja_env(template_dir)
+        self.assertEqual(
+            env.get_template('main.tf.j2').render(value='a&b<c>'),
+            'name = "a&b<c>"'
+        )
+        self.assertEqual(env.get_template('page.html').render(value='<b>'), '&lt;b&gt;')
+
     def test_generate_gitlab_ci(self):
         """Test GitLab CI generation"""
         generator = InfrastructureGenerator(
@@ -223,7 +289,7 @@ class TestInfrastructureGenerator(unittest.TestCase):
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        generator._generate_gitlab_ci(self.output_dir)
+        generator._render_ci('gitlab', self.output_dir)
 
         # Check that .gitlab-ci.yml was created
         gitlab_ci_file = self.output_dir / '.gitlab-ci.yml'
@@ -259,6 +325,32 @@ class TestInfrastructureGenerator(unittest.TestCase):
         self.assertTrue((config_dir / 'README.md').exists())
         self.assertTrue((config_dir / 'sample.tfvars.example').exists())
 
+    def test_sub_generators_create_their_own_directories(self):
+        """Test each sub-generator works on a fresh output dir without generate()"""
+        generator = InfrastructureGenerator(
+            project_name='myproject',
+            components=['vpc'],
+            environments=['dev'],
+            config={
+                'output_dir': str(self.output_dir),
+                'region': 'us-east-1',
+                'aws_account_id': '123456789000',
+                'ci_provider': 'github',
+                'backend_type': 's3',
+                'state_bucket': 'myproject-state'
+            }
+        )
+
+        generator._generate_component('vpc', self.output_dir / 'infra')
+        generator._render_ci('github', self.output_dir)
+        generator._generate_backend_scripts(self.output_dir)
+
+        self.assertTrue((self.output_dir / 'infra' / 'vpc' / 'main.tf').exists())
+        self.assertTrue(
+            (self.output_dir / '.github' / 'workflows' / 'terraform-ci.yml').exists()
+        )
+        self.assertTrue((self.output_dir / 'scripts' / 'init-backend.sh').exists())
+
     def test_generate_readme(self):
         """Test README generation"""
         generator = InfrastructureGenerator(
@@ -290,6 +382,28 @@ class TestInfrastructureGenerator(unittest.TestCase):
         self.assertIn('prod', content)
         self.assertIn('us-east-1', content)
 
+    def test_generate_readme_falls_back_to_packaged_template(self):
+        """Test a custom template_dir without readme/ still gets a README"""
+        custom_templates = Path(self.temp_dir) / 'custom-templates'
+        (custom_templates / 'vpc').mkdir(parents=True)
+
+        generator = InfrastructureGenerator(
+            project_name='test-project',
+            components=['vpc'],
+            environments=['dev'],
+            config={
+                'output_dir': str(self.output_dir),
+                'template_dir': str(custom_templates),
+                'region': 'us-east-1',
+                'aws_account_id': '161718192021'
+            }
+        )
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        generator._generate_readme(self.output_dir)
+
+        self.assertIn('test-project', (self.output_dir / 'README.md').read_text())
+
     def test_multiple_environments_in_readme(self):
         """Test README with multiple environments"""
         generator = InfrastructureGenerator(
@@ -400,18 +514,14 @@ class TestInfrastructureGenerator(unittest.TestCase):
         )
 
         # Mock circular dependencies
-        original_deps = generator.DEPENDENCIES.copy()
-        generator.DEPENDENCIES['vpc'] = ['eks-auto']
-        generator.DEPENDENCIES['eks-auto'] = ['vpc']
+        circular_deps = {'vpc': ['eks-auto'], 'eks-auto': ['vpc']}
+        with mock.patch.dict(InfrastructureGenerator.DEPENDENCIES, circular_deps):
+            with self.assertRaises(ValueError) as ctx:
+                generator._resolve(['vpc', 'eks-auto'])
 
-        # This should handle circular dependency gracefully
-        try:
-            sorted_comps = generator._sort_by_dependencies(['vpc', 'eks-auto'])
-            # Should still return all components even with circular dependency
-            self.assertEqual(len(sorted_comps), 2)
-        finally:
-            # Restore original dependencies
-            generator.DEPENDENCIES = original_deps
+        self.assertIn('Circular dependency', str(ctx.exception))
+        self.assertIn('vpc', str(ctx.exception))
+        self.assertIn('eks-auto', str(ctx.exception))
 
     def test_output_dir_already_exists(self):
         """Test generation when output directory already exists"""
@@ -471,7 +581,7 @@ class TestInfrastructureGenerator(unittest.TestCase):
         self.assertIn('eks-auto', generator.components)
 
     def test_jinja_env_different_component_dirs(self):
-        """Test Jinja2 environment updates for different component directories"""
+        """Test Jinja2 environment is cached per component directory"""
         generator = InfrastructureGenerator(
             project_name='myproject',
             components=['vpc'],
@@ -493,8 +603,10 @@ class TestInfrastructureGenerator(unittest.TestCase):
         env1 = generator._get_jinja_env(template_dir1)
         env2 = generator._get_jinja_env(template_dir2)
 
-        # Should be same cached object (reuses the cache)
-        self.assertIs(env1, env2)
+        # Each directory keeps its own environment (and compiled templates)
+        self.assertIsNot(env1, env2)
+        self.assertIs(env1, generator._get_jinja_env(template_dir1))
+        self.assertIs(env2, generator._get_jinja_env(template_dir2))
 
     def test_check_modules_needed_vpc_only(self):
         """Test that VPC only doesn't need modules"""
@@ -528,7 +640,7 @@ class TestInfrastructureGenerator(unittest.TestCase):
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        generator._generate_gitlab_ci(self.output_dir)
+        generator._render_ci('gitlab', self.output_dir)
 
         gitlab_ci_file = self.output_dir / '.gitlab-ci.yml'
         content = gitlab_ci_file.read_text()
@@ -546,6 +658,240 @@ class TestInfrastructureGenerator(unittest.TestCase):
         self.assertIn('Plan', content)
         self.assertIn('Apply', content)
 
+    def test_fallback_copy_from_infra(self):
+        """Test components without templates are copied from infra/"""
+        generator = InfrastructureGenerator(
+            project_name='myproject',
+            components=['vpc'],
+            environments=['dev'],
+            config={
+                'output_dir': str(self.output_dir),
+                'template_dir': str(Path(self.temp_dir) / 'no-templates'),
+                'region': 'us-east-1',
+                'aws_account_id': '123456789000'
+            }
+        )
+
+        # Source infra/services with an excluded file and a nested directory
+        src_dir = Path(self.temp_dir) / 'infra' / 'services'
+        (src_dir / 'values' / 'nested').mkdir(parents=True)
+        (src_dir / 'main.tf').write_text('resource "a" "b" {}\n')
+        (src_dir / 'sftp.tf').write_text('# client-specific\n')
+        (src_dir / 'values' / 'nested' / 'app.yaml').write_text('key: value\n')
+        (src_dir / 'code').mkdir()
+        (src_dir / 'code' / 'build.sh').write_text('#!/bin/sh\n')
+        (src_dir / 'code' / 'build.sh').chmod(0o755)
+
+        infra_dir = self.output_dir / 'infra'
+        (infra_dir / 'services').mkdir(parents=True)
+
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        try:
+            generator._generate_component('services', infra_dir)
+        finally:
+            os.chdir(cwd)
+
+        component_dir = infra_dir / 'services'
+        self.assertEqual((component_dir / 'main.tf').read_text(), 'resource "a" "b" {}\n')
+        self.assertFalse((component_dir / 'sftp.tf').exists())
+        self.assertEqual(
+            (component_dir / 'values' / 'nested' / 'app.yaml').read_text(),
+            'key: value\n'
+        )
+        # Subdirectory files keep their permission bits
+        self.assertEqual((component_dir / 'code' / 'build.sh').stat().st_mode & 0o777, 0o755)
+
+    def test_fast_copy_file_fallbacks(self):
+        """Test file copies succeed when kernel-side copy calls are unavailable"""
+        src = Path(self.temp_dir) / 'src.bin'
+        src.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+
+        failing = mock.Mock(side_effect=OSError)
+        with mock.patch.object(os, 'copy_file_range', failing, create=True):
+            _fast_copy_file(str(src), str(Path(self.temp_dir) / 'sendfile.bin'))
+            with mock.patch.object(os, 'sendfile', failing, create=True):
+                _fast_copy_file(str(src), str(Path(self.temp_dir) / 'buffered.bin'))
+
+        for name in ('sendfile.bin', 'buffered.bin'):
+            with self.subTest(name=name):
+                self.assertEqual((Path(self.temp_dir) / name).read_bytes(), src.read_bytes())
+
+    def test_write_file_is_atomic(self):
+        """Test an interrupted write keeps the previous file and leaves no temp file"""
+        target = Path(self.temp_dir) / 'script.sh'
+        old_umask = os.umask(0o022)
+        try:
+            _write_file(str(target), b'#!/bin/bash\n', mode=0o755)
+        finally:
+            os.umask(old_umask)
+        self.assertEqual(target.read_bytes(), b'#!/bin/bash\n')
+        self.assertEqual(target.stat().st_mode & 0o777, 0o755)
+
+        with mock.patch('os.write', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                _write_file(str(target), b'echo partial\n')
+
+        self.assertEqual(target.read_bytes(), b'#!/bin/bash\n')
+        self.assertEqual(os.listdir(self.temp_dir), ['script.sh'])
+
+    def test_write_file_modes(self):
+        """Test explicit modes are applied, otherwise replaced files keep their mode"""
+        target = Path(self.temp_dir) / 'main.tf'
+        script = Path(self.temp_dir) / 'init.sh'
+        old_umask = os.umask(0o077)
+        try:
+            # New file without a mode: 0o666 minus the umask
+            _write_file(str(target), b'one\n')
+            self.assertEqual(target.stat().st_mode & 0o777, 0o600)
+
+            # Replaced file without a mode keeps its current mode
+            target.chmod(0o640)
+            _write_file(str(target), b'two\n')
+            self.assertEqual(target.read_bytes(), b'two\n')
+            self.assertEqual(target.stat().st_mode & 0o777, 0o640)
+
+            # An explicit mode wins over the existing one, minus the umask
+            script.write_text('#!/bin/sh\n')
+            script.chmod(0o644)
+            _write_file(str(script), b'#!/bin/sh\n', mode=0o755)
+            self.assertEqual(script.stat().st_mode & 0o777, 0o700)
+
+            os.umask(0o022)
+            _write_file(str(script), b'#!/bin/sh\n', mode=0o755)
+            self.assertEqual(script.stat().st_mode & 0o777, 0o755)
+        finally:
+            os.umask(old_umask)
+
+    def test_write_file_long_name(self):
+        """Test the temporary file name does not grow with the target name"""
+        target = Path(self.temp_dir) / ('a' * 250 + '.tf')
+        _write_file(str(target), b'x\n')
+        self.assertEqual(target.read_bytes(), b'x\n')
+
+    def test_render_follows_symlinked_templates(self):
+        """Test .j2 templates that are symlinks are rendered like regular files"""
+        template_root = Path(self.temp_dir) / 'templates'
+        shared = Path(self.temp_dir) / 'shared'
+        (template_root / 'vpc').mkdir(parents=True)
+        shared.mkdir()
+        (shared / 'versions.tf.j2').write_text('# {{ project_name }}\n')
+        (template_root / 'vpc' / 'versions.tf.j2').symlink_to(shared / 'versions.tf.j2')
+
+        generator = InfrastructureGenerator(
+            project_name='myproject',
+            components=['vpc'],
+            environments=['dev'],
+            config={
+                'output_dir': str(self.output_dir),
+                'template_dir': str(template_root),
+                'region': 'us-east-1',
+                'aws_account_id': '123456789000'
+            }
+        )
+
+        generator._generate_component('vpc', self.output_dir / 'infra')
+        rendered = self.output_dir / 'infra' / 'vpc' / 'versions.tf'
+        self.assertEqual(rendered.read_text(), '# myproject')
+
+    def test_render_rejects_symlinked_output_file(self):
+        """Test rendering refuses to write through a symlink leaving the component dir"""
+        template_root = Path(self.temp_dir) / 'templates'
+        (template_root / 'vpc').mkdir(parents=True)
+        (template_root / 'vpc' / 'main.tf.j2').write_text('# {{ project_name }}\n')
+
+        generator = InfrastructureGenerator(
+            project_name='myproject',
+            components=['vpc'],
+            environments=['dev'],
+            config={
+                'output_dir': str(self.output_dir),
+                'template_dir': str(template_root),
+                'region': 'us-east-1',
+                'aws_account_id': '123456789000'
+            }
+        )
+
+        outside = Path(self.temp_dir) / 'outside.tf'
+        outside.write_text('untouched\n')
+        component_dir = self.output_dir / 'infra' / 'vpc'
+        component_dir.mkdir(parents=True)
+        (component_dir / 'main.tf').symlink_to(outside)
+
+        with self.assertRaises(ValueError):
+            generator._generate_component('vpc', self.output_dir / 'infra')
+        self.assertEqual(outside.read_text(), 'untouched\n')
+
+    def test_copy_modules_copies_files(self):
+        """Test modules/ is copied (not linked) with its modes and ignore patterns apply"""
+        generator = InfrastructureGenerator(
+            project_name='myproject',
+            components=['vpc'],
+            environments=['dev'],
+            config={
+                'output_dir': str(self.output_dir),
+                'region': 'us-east-1',
+                'aws_account_id': '123456789000'
+            }
+        )
+
+        modules_src = Path(self.temp_dir) / 'modules' / 'sftp'
+        modules_src.mkdir(parents=True)
+        (modules_src / 'main.tf').write_text('module {}\n')
+        (modules_src / 'cache.pyc').write_bytes(b'')
+        (modules_src / 'build.sh').write_text('#!/bin/sh\n')
+        (modules_src / 'build.sh').chmod(0o755)
+        self.output_dir.mkdir(parents=True)
+
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        try:
+            generator._copy_modules(self.output_dir)
+        finally:
+            os.chdir(cwd)
+
+        copied = self.output_dir / 'modules' / 'sftp' / 'main.tf'
+        self.assertEqual(copied.read_text(), 'module {}\n')
+        self.assertFalse(os.path.samefile(copied, modules_src / 'main.tf'))
+        script = self.output_dir / 'modules' / 'sftp' / 'build.sh'
+        self.assertEqual(script.stat().st_mode & 0o777, 0o755)
+        self.assertFalse((self.output_dir / 'modules' / 'sftp' / 'cache.pyc').exists())
+
+    def test_copy_modules_skips_unchanged_source(self):
+        """Test modules/ is only re-copied when the source tree changes"""
+        generator = InfrastructureGenerator(
+            project_name='myproject',
+            components=['vpc'],
+            environments=['dev'],
+            config={
+                'output_dir': str(self.output_dir),
+                'region': 'us-east-1',
+                'aws_account_id': '123456789000'
+            }
+        )
+
+        modules_src = Path(self.temp_dir) / 'modules' / 'sftp'
+        modules_src.mkdir(parents=True)
+        (modules_src / 'main.tf').write_text('module {}\n')
+        self.output_dir.mkdir(parents=True)
+
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        try:
+            generator._copy_modules(self.output_dir)
+            with mock.patch('shutil.copytree') as copytree:
+                generator._copy_modules(self.output_dir)
+            copytree.assert_not_called()
+
+            (modules_src / 'variables.tf').write_text('variable "name" {}\n')
+            generator._copy_modules(self.output_dir)
+        finally:
+            os.chdir(cwd)
+
+        self.assertTrue((self.output_dir / 'modules' / 'sftp' / 'variables.tf').exists())
+        self.assertFalse((self.output_dir / 'modules.tmp').exists())
+        self.assertFalse((self.output_dir / 'modules.old').exists())
+
 
 class TestErrorHandling(unittest.TestCase):
     """Test error handling in InfrastructureGenerator"""
@@ -554,6 +900,7 @@ class TestErrorHandling(unittest.TestCase):
         """Set up test fixtures"""
         self.temp_dir = tempfile.mkdtemp()
         self.output_dir = Path(self.temp_dir) / 'output'
+        isolate_template_cache(self)
 
     def tearDown(self):
         """Clean up test fixtures"""
@@ -576,7 +923,19 @@ class TestErrorHandling(unittest.TestCase):
 
         # Should raise FileNotFoundError when trying to generate GitLab CI
         with self.assertRaises(FileNotFoundError):
-            generator._generate_gitlab_ci(self.output_dir)
+            generator._render_ci('gitlab', self.output_dir)
+
+    def test_unwritable_template_cache_disables_caching(self):
+        """Test an existing but unwritable cache directory disables caching"""
+        cache_dir = Path(self.temp_dir) / 'readonly-cache'
+        cache_dir.mkdir(mode=0o500)
+        _get_bytecode_cache.cache_clear()
+        # os.access is patched as well, since root bypasses the permission bits
+        with mock.patch.dict(os.environ, {'INFRA_JINJA_CACHE': str(cache_dir)}), \
+                mock.patch('os.access', return_value=False), \
+                self.assertLogs('generators.generate_infrastructure', level='WARNING') as logs:
+            self.assertIsNone(_get_bytecode_cache())
+        self.assertIn('caching disabled', logs.output[0])
 
     def test_invalid_component_name(self):
         """Test with invalid component name"""
@@ -680,6 +1039,7 @@ class TestTemplateRendering(unittest.TestCase):
         """Set up test fixtures"""
         self.temp_dir = tempfile.mkdtemp()
         self.output_dir = Path(self.temp_dir) / 'output'
+        isolate_template_cache(self)
 
     def tearDown(self):
         """Clean up test fixtures"""
@@ -768,6 +1128,7 @@ class TestGitLabCITemplate(unittest.TestCase):
         """Set up test fixtures"""
         self.temp_dir = tempfile.mkdtemp()
         self.output_dir = Path(self.temp_dir) / 'output'
+        isolate_template_cache(self)
 
     def tearDown(self):
         """Clean up test fixtures"""
@@ -790,7 +1151,7 @@ class TestGitLabCITemplate(unittest.TestCase):
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        generator._generate_gitlab_ci(self.output_dir)
+        generator._render_ci('gitlab', self.output_dir)
 
         gitlab_ci_file = self.output_dir / '.gitlab-ci.yml'
         content = gitlab_ci_file.read_text()
@@ -800,6 +1161,30 @@ class TestGitLabCITemplate(unittest.TestCase):
         self.assertIn('image:', content)
         self.assertIn('variables:', content)
 
+    def test_validate_yaml_rejects_invalid_yaml(self):
+        """Test that YAML syntax errors in rendered CI files are reported"""
+        generator = InfrastructureGenerator(
+            project_name='myproject',
+            components=['vpc'],
+            environments=['dev'],
+            config={
+                'output_dir': str(self.output_dir),
+                'region': 'us-east-1',
+                'aws_account_id': '444555666777'
+            }
+        )
+
+        generator._validate_yaml(b'stages:\n  - plan\n', self.output_dir / 'valid.yml')
+        invalid = [
+            b'stages: [plan\njob:\n  script: x\n',       # Syntax error
+            b'a: *undefined\n',                          # Undefined alias
+            b'a: !!python/object:os.system x\n',         # Unsafe tag
+        ]
+        for data in invalid:
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    generator._validate_yaml(data, self.output_dir / 'invalid.yml')
+
     def test_gitlab_ci_job_naming(self):
         """Test that GitLab CI jobs are properly named with components"""
         generator = InfrastructureGenerator(
@@ -816,7 +1201,7 @@ class TestGitLabCITemplate(unittest.TestCase):
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        generator._generate_gitlab_ci(self.output_dir)
+        generator._render_ci('gitlab', self.output_dir)
 
         content = (self.output_dir / '.gitlab-ci.yml').read_text()
 
@@ -842,7 +1227,7 @@ class TestGitLabCITemplate(unittest.TestCase):
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        generator._generate_gitlab_ci(self.output_dir)
+        generator._render_ci('gitlab', self.output_dir)
 
         content = (self.output_dir / '.gitlab-ci.yml').read_text()
 
@@ -859,6 +1244,7 @@ class TestInfrastructureGeneratorIntegration(unittest.TestCase):
         """Set up test fixtures"""
         self.temp_dir = tempfile.mkdtemp()
         self.output_dir = Path(self.temp_dir) / 'generated'
+        isolate_template_cache(self)
 
     def tearDown(self):
         """Clean up test fixtures"""
@@ -927,6 +1313,38 @@ class TestInfrastructureGeneratorIntegration(unittest.TestCase):
         self.assertIn('dev', gitlab_ci_content)
         self.assertIn('prod', gitlab_ci_content)
 
+    def test_component_progress_is_grouped(self):
+        """Test per-file progress is logged under its component, in component order"""
+        template_dir = Path(__file__).parent.parent / 'template-modules' / 'vpc'
+        if not template_dir.exists():
+            self.skipTest("Template directory not found")
+
+        generator = InfrastructureGenerator(
+            project_name='myproject',
+            components=['vpc', 'rds'],
+            environments=['dev'],
+            config={
+                'output_dir': str(self.output_dir),
+                'template_dir': 'template-modules',
+                'region': 'us-east-1',
+                'aws_account_id': '123456789000'
+            }
+        )
+        generator.validate_components()
+
+        with self.assertLogs('generators.generate_infrastructure', level='INFO') as logs:
+            generator.generate()
+
+        messages = [record.getMessage() for record in logs.records]
+        vpc_start = messages.index('📝 Generating component: vpc')
+        rds_start = messages.index('📝 Generating component: rds')
+        vpc_files = sorted(p.name for p in (self.output_dir / 'infra' / 'vpc').iterdir())
+        self.assertEqual(
+            messages[vpc_start + 1:rds_start],
+            [f'  Generated: {name}' for name in vpc_files]
+            + [f'✓ component vpc: generated {len(vpc_files)} files']
+        )
+
 
 class TestSecurityIntegration(unittest.TestCase):
     """Test security features integration"""
@@ -935,6 +1353,7 @@ class TestSecurityIntegration(unittest.TestCase):
         """Set up test fixtures"""
         self.temp_dir = tempfile.mkdtemp()
         self.output_dir = Path(self.temp_dir) / 'output'
+        isolate_template_cache(self)
 
     def tearDown(self):
         """Clean up test fixtures"""
@@ -991,5 +1410,31 @@ class TestSecurityIntegration(unittest.TestCase):
         # This is tested indirectly through template rendering
 
 
+class TestCliArgumentTypes(unittest.TestCase):
+    """Test argparse type converters used by main()"""
+
+    def test_csv_list(self):
+        """Test comma-separated values are split and stripped"""
+        self.assertEqual(_csv_list('vpc, eks-auto ,rds'), ['vpc', 'eks-auto', 'rds'])
+
+    def test_csv_list_rejects_empty_items(self):
+        """Test empty lists and empty items are rejected instead of silently dropped"""
+        for value in ('', ',', ' , ', 'vpc,,rds', 'vpc,'):
+            with self.subTest(value=value):
+                with self.assertRaises(argparse.ArgumentTypeError):
+                    _csv_list(value)
+
+    def test_parse_vpc_cidrs(self):
+        """Test VPC CIDR JSON objects are parsed"""
+        self.assertEqual(_parse_vpc_cidrs('{"dev": "10.0.0.0/16"}'), {'dev': '10.0.0.0/16'})
+
+    def test_parse_vpc_cidrs_ignores_invalid(self):
+        """Test invalid or non-object JSON warns and falls back to defaults"""
+        for value in ('{dev:10.0.0.0/16}', '["10.0.0.0/16"]', '"dev"'):
+            with self.subTest(value=value):
+                with self.assertLogs('generators.generate_infrastructure', level='WARNING'):
+                    self.assertEqual(_parse_vpc_cidrs(value), {})
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -18,6 +18,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
 
 from generators.generate_infrastructure import InfrastructureGenerator
 from security.validator import SecurityValidator
+from tests.test_infrastructure_generator import isolate_template_cache
 
 
 class IntegrationTestBase(unittest.TestCase):
@@ -29,6 +30,9 @@ class IntegrationTestBase(unittest.TestCase):
         self.output_dir = Path(self.temp_dir) / 'generated-infra'
         self.template_dir = Path(__file__).parent.parent / 'template-modules'
 
+        # Keep compiled templates out of ~/.cache and start every test cold
+        isolate_template_cache(self)
+
     def tearDown(self):
         """Clean up test fixtures"""
         if Path(self.temp_dir).exists():
@@ -49,6 +49,7 @@ class TestSecurityValidator(unittest.TestCase):
             'pro_ject',  # Contains underscore
             'pro.ject',  # Contains dot
             'a' * 64,  # Too long
+            'a' * 10000,  # Rejected before normalization
             'admin',  # Reserved name
             'tmp',  # Reserved name
         ]
@@ -64,6 +65,10 @@ class TestSecurityValidator(unittest.TestCase):
         result = SecurityValidator.validate_project_name('My-Project')
         self.assertEqual(result, 'my-project')
 
+        # Full-width characters fold to ASCII (NFKC)
+        result = SecurityValidator.validate_project_name('Ｍｙ-Ｐｒｏｊｅｃｔ')
+        self.assertEqual(result, 'my-project')
+
     def test_validate_component_valid(self):
         """Test valid component names"""
         valid = ['vpc', 'eks-auto', 'rds', 'eks', 'services']
@@ -136,6 +141,7 @@ class TestSecurityValidator(unittest.TestCase):
             '12345678901',  # Too short
             '1234567890123',  # Too long
             'abcd12345678',  # Contains letters
+            '１２３４５６７８９０００',  # Non-ASCII digits
             '000000000000',  # Fake ID
             '123456789012',  # Fake ID
         ]
@@ -206,6 +212,7 @@ class TestSecurityValidator(unittest.TestCase):
                 'safe': 'value'
             },
             'list': ['a', 'b', 'c'],
+            'list_with_null': ['a\x00b', 1],
             'string_with_null': 'test\x00bad',
         }
 
@@ -226,6 +233,11 @@ class TestSecurityValidator(unittest.TestCase):
 
         # Should remove null bytes from strings
         self.assertNotIn('\x00', result.get('string_with_null', ''))
+        self.assertEqual(result['list_with_null'], ['ab', 1])
+
+        # Lists are copied, never shared with the input context
+        self.assertEqual(result['list'], ['a', 'b', 'c'])
+        self.assertIsNot(result['list'], context['list'])
 
     def test_validate_filename_valid(self):
         """Test valid filenames"""
@@ -305,6 +317,23 @@ class TestValidateAllInputs(unittest.TestCase):
         self.assertEqual(result['region'], 'us-east-1')
         self.assertEqual(result['aws_account_id'], '123456789000')
 
+    def test_repeated_inputs_return_fresh_lists(self):
+        """Test memoized results do not share mutable lists between calls"""
+        kwargs = dict(
+            project_name='my-project',
+            components=['vpc'],
+            environments=['dev'],
+            region='us-east-1',
+            aws_account_id='123456789000'
+        )
+
+        first = validate_all_inputs(**kwargs)
+        first['components'].append('rds')
+        second = validate_all_inputs(**kwargs)
+
+        self.assertEqual(second['components'], ['vpc'])
+        self.assertIsNot(first['environments'], second['environments'])
+
     def test_invalid_project_name(self):
         """Test with invalid project name"""
         with self.assertRaises(ValueError):